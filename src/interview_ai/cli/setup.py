@@ -31,13 +31,15 @@ def _setup_config(paths: List[str]) -> None:
                     "storage_mode": "[Options]: memory or database. To use database, add related database uri in environment variables. Supported databases are postgres, sqlite, mongodb. See .example-env for more details.",
                     "internet_search": "[Options]: duckduckgo, bing. To use bing, add BING_SUBSCRIPTION_KEY and BING_SEARCH_URL in environment variables. See .example-env for more details.",
                     "database_name": "[Options]: postgres, sqlite, mongodb. To use database, add related database uri in environment variables. See .example-env for more details.",
-                    "use_toon_formatting": "[Options]: true, false. If true, all the llm inputs will be optimized using TOON data format conversions. This will reduce token consumtion for all the input messages but will add few static tokens as system message to explain the format to LLM."
+                    "use_toon_formatting": "[Options]: true, false. If true, all the llm inputs will be optimized using TOON data format conversions. This will reduce token consumtion for all the input messages but will add few static tokens as system message to explain the format to LLM.",
+                    "pdf_render_workers": "Number of worker processes that render pdf files, 0 renders them in the server process. Workers re-import your server's main module, keep the server start and client setup under if __name__ == \"__main__\": when enabling this."
                 },
                 "llm_model_name": "gpt-4.1-mini",
                 "storage_mode": "memory",
                 "internet_search": "duckduckgo",
                 "database_name": "sqlite",
-                "use_toon_formatting": False
+                "use_toon_formatting": False,
+                "pdf_render_workers": 0
             }
             file.write(json.dumps(data, indent=4))
         print(f"{path}/ created!")
@@ -1,6 +1,4 @@
-import json
-from datetime import datetime, timezone, timedelta
-from uuid import uuid4
+import json, time, secrets
 from typing import List
 from ..core.settings import settings
 from ..core.cache import cache
@@ -28,23 +26,21 @@ class InterviewClient:
         self.max_questions = self.interview_rules.get(
             "no_of_questions", 10
         ) + settings.max_intro_questions
+        # Answer time frame (minutes) + 5 seconds buffer, in seconds
+        self._expiry_seconds = float(self.interview_rules.get("time_frame", 0)) * 60 + 5
 
-    def _check_answer_expiry(self, user_message: str, last_updated: str) -> str:
+    def _check_answer_expiry(self, user_message: str, last_updated: float) -> str:
         """
         Check if the answer is expired.
 
         Args:
             user_message (str): The user message to be checked.
-            last_updated (str): The last updated time of the user message.
+            last_updated (float): The last updated time of the user message, as a Unix timestamp.
 
         Returns:
             str: The user message if it is not expired, otherwise an empty string.
         """
-        if datetime.fromisoformat(last_updated) < datetime.now(timezone.utc) - timedelta(
-            minutes=float(self.interview_rules.get("time_frame", 0)), seconds=float(5)
-        ):
-            return ""
-        return user_message
+        return user_message if time.time() - last_updated <= self._expiry_seconds else ""
 
     def start(self) -> dict:
         """
@@ -53,7 +49,7 @@ class InterviewClient:
         Returns:
             dict: The interview configuration and initial interrupt message.
         """
-        interview_id = str(uuid4())
+        interview_id = secrets.token_hex(16)
         interview_config = {"configurable": {"thread_id": interview_id}}
         response = interviewbot.invoke({
             "messages": [HumanMessage(content="Start Interview")],
@@ -67,7 +63,7 @@ class InterviewClient:
                 "text": response['__interrupt__'][0].value,
                 "type": "interrupt"
             },
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": time.time(),
             "count": 0
         }
 
@@ -92,7 +88,8 @@ class InterviewClient:
         """
         if not interview_config: raise ValueError("Interview config is required")
 
-        cached_data = load_cache(interview_config['configurable']['thread_id'], interviewbot)
+        thread_id = interview_config['configurable']['thread_id']
+        cached_data = load_cache(thread_id, interviewbot)
 
         if cached_data["count"] >= self.max_questions: return "__end__"
 
@@ -109,19 +106,25 @@ class InterviewClient:
             }, interview_config)
         
         if response and "__interrupt__" in response:
-            cached_data["last_message"] = {
+            last_message = {
                 "text": response['__interrupt__'][0].value,
                 "type": "interrupt"
             }
         else:
-            cached_data["last_message"] = {
+            last_message = {
                 "text": response["messages"][-1].content,
                 "type": "text"
             }
+
+        def _advance(current_data: dict | None) -> dict:
+            # Entry may have been evicted while the graph was running
+            current_data = current_data or cached_data
+            current_data["last_message"] = last_message
+            current_data["count"] += 1
+            current_data["last_updated"] = time.time()
+            return current_data
         
-        cached_data["count"] += 1
-        cached_data["last_updated"] = datetime.now(timezone.utc).isoformat()
-        cache.set(interview_config['configurable']['thread_id'], cached_data)
+        cached_data = cache.update(thread_id, _advance)
 
         return "__end__" if (
             cached_data["count"] >= self.max_questions
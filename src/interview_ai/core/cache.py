@@ -1,9 +1,10 @@
 from collections import OrderedDict
-from typing import Any
+from threading import Lock
+from typing import Any, Callable
 
 
 class SimpleCache:
-    """Simple LRU Cache implementation"""
+    """Simple thread-safe LRU Cache implementation"""
 
     def __init__(self, maxsize: int = 128) -> None:
         """
@@ -17,27 +18,61 @@ class SimpleCache:
         """
         self.cache = OrderedDict()
         self.maxsize = maxsize
+        self._lock = Lock()
 
-    def get(self, key: str) -> str | None:
+    def get(self, key: str, touch: bool = False) -> str | None:
         """
         Get the value for a given key from the cache.
 
         Args:
             key (str): Key to retrieve the value for.
+            touch (bool, optional): Whether to mark the key as recently used. Defaults to False.
 
         Returns:
             str | None: Value associated with the key, or None if the key is not in the cache.
         """
-        if key not in self.cache: return None
+        with self._lock:
+            value = self.cache.get(key)
 
-        # Move to end to mark as "Recently Used"
-        self.cache.move_to_end(key)
-        return self.cache[key]
+            # Move to end to mark as "Recently Used"
+            if touch and key in self.cache: self.cache.move_to_end(key)
+            return value
 
     def set(self, key: str, value: str | dict | Any) -> None:
         """
         Set the value for a given key in the cache.
 
+        Args:
+            key (str): Key to set the value for.
+            value (str | dict | Any): Value to set for the key.
+
+        Returns:
+            None
+        """
+        with self._lock: self._store(key, value)
+
+    def update(self, key: str, updater: Callable[[Any], Any]) -> Any:
+        """
+        Atomically read, update and write back the value for a given key.
+
+        Args:
+            key (str): Key to update the value for.
+            updater (Callable[[Any], Any]): Function receiving the current value (None if missing)
+                                            and returning the new value. Must not use the cache itself.
+
+        Returns:
+            Any: The updated value.
+        """
+        with self._lock:
+            value = updater(self.cache.get(key))
+            self._store(key, value)
+            return value
+
+    def _store(self, key: str, value: str | dict | Any) -> None:
+        """
+        Store the value for a given key and evict the oldest entry if over capacity.
+        Callers must hold the cache lock.
+
         Args:
             key (str): Key to set the value for.
             value (str | dict | Any): Value to set for the key.
@@ -1,7 +1,7 @@
-import os, uuid, json, torch, re
+import os, json, re, secrets, queue, threading, time
+from contextlib import nullcontext
 from typing import Any, Optional, List, Sequence
 from pydantic import BaseModel, Field
-from transformers import AutoModelForCausalLM, AutoTokenizer
 from langchain_openai.chat_models import ChatOpenAI
 from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -14,37 +14,149 @@ from langchain_core.tools import BaseTool
 from .settings import settings
 
 
+# Tool call block emitted by local models
+_TOOLCALL_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
+# LLM provider selection, read once at import like the settings defaults
+_HAS_OPENAI_KEY = bool(os.environ.get("OPENAI_API_KEY"))
+_HAS_GOOGLE_KEY = bool(os.environ.get("GOOGLE_API_KEY"))
+
+
+class _GenerationBatcher:
+    """
+    Coalesce concurrent local model generations into a single batched generate call,
+    decoding is memory-bandwidth-bound so small batches cost about the same as one request.
+    """
+
+    def __init__(self, model: "LocalModel", max_batch_size: int = 4, batch_wait_ms: float = 10.0) -> None:
+        """
+        Initialize the batcher and start its background worker.
+
+        Args:
+            model (LocalModel): Local model used to generate the batched responses.
+            max_batch_size (int, optional): Maximum prompts per generate call. Defaults to 4.
+            batch_wait_ms (float, optional): Time to wait for more prompts after the first one. Defaults to 10.0.
+        
+        Returns:
+            None
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="local-model-batcher", daemon=True)
+        self._worker.start()
+
+    def generate(self, prompt: str) -> str:
+        """
+        Queue a prompt for the next batch and wait for its generated text.
+
+        Args:
+            prompt (str): Conversation context to generate a response for.
+        
+        Returns:
+            str: Generated text.
+        """
+        request = {"prompt": prompt, "done": threading.Event(), "result": None, "error": None}
+        self._queue.put(request)
+        request["done"].wait()
+
+        if request["error"] is not None: raise request["error"]
+        return request["result"]
+
+    def _collect(self) -> list[dict]:
+        """
+        Block for the first queued request, then gather more until the batch is full or the wait is over.
+
+        Returns:
+            list[dict]: Requests to be generated together.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: break
+
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        """
+        Worker loop generating queued requests batch by batch.
+
+        Returns:
+            None
+        """
+        while True:
+            batch = self._collect()
+
+            try:
+                results = self.model._generate_texts([request["prompt"] for request in batch])
+                for request, result in zip(batch, results): request["result"] = result
+            except Exception as ex:
+                for request in batch: request["error"] = ex
+            finally:
+                for request in batch: request["done"].set()
+
+
 class LocalModel(BaseChatModel):
     """Local model implementation for locally hosted models"""
 
     client: Any = Field(default=None, exclude=True)
     tokenizer: Any = Field(default=None, exclude=True)
+    batcher: Any = Field(default=None, exclude=True)
     fine_tune: bool = Field(default=False)
-    device: torch.device = Field(default="cpu", exclude=True)
+    device: Any = Field(default="cpu", exclude=True)
 
-    def __init__(self, model: str, fine_tune: bool = False) -> None:
+    def __init__(
+        self, model: str, fine_tune: bool = False, batch_size: int = 4, batch_wait_ms: float = 10.0
+    ) -> None:
         """
         Initialize the local model.
 
         Args:
             model (str): Huggingface model name.
             fine_tune (bool, optional): Whether to fine-tune the model with each run. Defaults to False.
+            batch_size (int, optional): Maximum concurrent requests generated together. Defaults to 4.
+            batch_wait_ms (float, optional): Time to wait for concurrent requests to batch. Defaults to 10.0.
         
         Returns:
             None
         """
+        # Heavy imports are deferred so hosted LLM deployments never load torch/transformers
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
         super().__init__()
         self.fine_tune = fine_tune
 
+        dtype = torch.bfloat16
+
         if torch.backends.mps.is_available():
             self.device = torch.device("mps")
+            # bfloat16 support on MPS is patchy, use float16 instead
+            dtype = torch.float16
+
+        model_kwargs = {"dtype": dtype, "attn_implementation": "sdpa", "low_cpu_mem_usage": True}
 
         try:
             self.tokenizer = AutoTokenizer.from_pretrained(model, local_files_only=True)
-            self.client = AutoModelForCausalLM.from_pretrained(model, local_files_only=True).to(self.device)
+            self.client = AutoModelForCausalLM.from_pretrained(
+                model, local_files_only=True, **model_kwargs
+            ).to(self.device)
         except:
             self.tokenizer = AutoTokenizer.from_pretrained(model)
-            self.client = AutoModelForCausalLM.from_pretrained(model).to(self.device)
+            self.client = AutoModelForCausalLM.from_pretrained(model, **model_kwargs).to(self.device)
+
+        # Batched prompts are left padded so generated tokens start at the same offset
+        if self.tokenizer.pad_token is None: self.tokenizer.pad_token = self.tokenizer.eos_token
+        self.tokenizer.padding_side = "left"
+        self.batcher = _GenerationBatcher(self, batch_size, batch_wait_ms)
     
     @property
     def _llm_type(self) -> str:
@@ -79,38 +191,32 @@ class LocalModel(BaseChatModel):
         Returns:
             ChatResult: Generated chat result object.
         """
-        conversation_context = ""
+        context_parts = []
         generated_texts_list = []
-        tools_block = {
-            "available_tools": [convert_to_openai_tool(tool) for tool in kwargs.get("tools", [])],
-            "tool_config": kwargs.get("tool_config")
-        }
+        # Tool definitions are serialized once in bind_tools, build them here only for unbound calls
+        tools_json = kwargs.get("tools_json")
 
         for message in messages:
             if message.type == "human":
-                conversation_context += f"User: {message.content}\n"
+                context_parts.append(f"User: {message.content}\n")
             elif message.type == "ai":
-                conversation_context += f"Assistant: {message.content}\n"
+                context_parts.append(f"Assistant: {message.content}\n")
             elif message.type == "system":
-                conversation_context += f"System: {message.content}\n"
-                tools_json = json.dumps(tools_block, indent=2)
-                conversation_context += f"\n# Available Tools\nYou have access to the following tools. To call a tool, respond with a JSON object inside a ```json code block using this format:\n{{\n\"tool\": \"tool_name\",\n\"parameters\": {{ \"param1\": \"value1\" }}\n}}\n\n## Tool Definitions:\n{tools_json}\n"
+                context_parts.append(f"System: {message.content}\n")
+
+                if tools_json is None:
+                    tools_json = self._serialize_tools(kwargs.get("tools", []), kwargs.get("tool_config"))
+                context_parts.append(f"\n# Available Tools\nYou have access to the following tools. To call a tool, respond with a JSON object inside a ```json code block using this format:\n{{\n\"tool\": \"tool_name\",\n\"parameters\": {{ \"param1\": \"value1\" }}\n}}\n\n## Tool Definitions:\n{tools_json}\n")
 
-        tokenized_input = self.tokenizer(conversation_context, return_tensors="pt").to(self.device)
+        conversation_context = "".join(context_parts)
 
         if self.fine_tune:
-            llm_response = self.client.generate(
-                tokenized_input["input_ids"], max_new_tokens=256, num_return_sequences=1
-            )
+            # Fine tuning runs need autograd, so they bypass the inference batcher
+            message = self._generate_texts([conversation_context], inference=False)[0]
         else:
-            with torch.no_grad():
-                llm_response = self.client.generate(
-                    tokenized_input["input_ids"], max_new_tokens=256, num_return_sequences=1
-                )
-        
-        input_length = tokenized_input["input_ids"].shape[1]
-        message = self.tokenizer.decode(llm_response[0][input_length:], skip_special_tokens=True)
-        json_match = re.search(r"```json\s*(.*?)\s*```", message, re.DOTALL)
+            message = self.batcher.generate(conversation_context)
+
+        json_match = _TOOLCALL_RE.search(message)
 
         if json_match:
             try:
@@ -118,7 +224,7 @@ class LocalModel(BaseChatModel):
                 tool_call = ToolCall(
                     name=data["tool"],
                     args=data["parameters"],
-                    id=str(uuid.uuid4())
+                    id=secrets.token_hex(16)
                 )
                 generated_texts_list.append(ChatGeneration(
                     message=AIMessage(content=message, tool_calls=[tool_call]), generation_info={}
@@ -133,6 +239,37 @@ class LocalModel(BaseChatModel):
             )
         
         return ChatResult(generations=generated_texts_list)
+
+    def _generate_texts(self, prompts: List[str], inference: bool = True) -> List[str]:
+        """
+        Generate responses for a batch of prompts with a single model generate call.
+
+        Args:
+            prompts (List[str]): Conversation contexts to generate responses for.
+            inference (bool, optional): Whether to run under torch inference mode. Defaults to True.
+        
+        Returns:
+            List[str]: Generated texts, in the same order as the prompts.
+        """
+        import torch
+
+        tokenized_input = self.tokenizer(prompts, return_tensors="pt", padding=True).to(self.device)
+        generation_kwargs = {
+            "max_new_tokens": 256,
+            "num_return_sequences": 1,
+            "use_cache": True,
+            "do_sample": False,
+            "pad_token_id": self.tokenizer.pad_token_id
+        }
+
+        # Inference mode also skips autograd version tracking, unlike no_grad
+        with torch.inference_mode() if inference else nullcontext():
+            llm_response = self.client.generate(**tokenized_input, **generation_kwargs)
+
+        input_length = tokenized_input["input_ids"].shape[1]
+        return [
+            self.tokenizer.decode(response[input_length:], skip_special_tokens=True) for response in llm_response
+        ]
     
     def bind_tools(
         self, tools: Sequence[dict[str, Any] | BaseTool], **kwargs: Any
@@ -148,7 +285,25 @@ class LocalModel(BaseChatModel):
             Runnable[LanguageModelInput, AIMessage]: Runnable object.
         """
         formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
-        return self.bind(tools=formatted_tools, **kwargs)
+        tools_json = self._serialize_tools(formatted_tools, kwargs.get("tool_config"))
+        return self.bind(tools=formatted_tools, tools_json=tools_json, **kwargs)
+
+    @staticmethod
+    def _serialize_tools(tools: Sequence[dict[str, Any] | BaseTool], tool_config: Any = None) -> str:
+        """
+        Serialize tool definitions into the JSON block injected into the system prompt.
+
+        Args:
+            tools (Sequence[dict[str, Any] | BaseTool]): List of tools to serialize.
+            tool_config (Any, optional): Tool configuration. Defaults to None.
+        
+        Returns:
+            str: Indented JSON string of the tool definitions.
+        """
+        return json.dumps({
+            "available_tools": [convert_to_openai_tool(tool) for tool in tools],
+            "tool_config": tool_config
+        }, indent=2)
 
 
 class Model:
@@ -171,11 +326,15 @@ class Model:
             None
         """
         self.tools = tools
-        self.tools_by_name = {tool.name: tool for tool in self.tools}
+        # Convert once, every backend's bind_tools accepts OpenAI tool schemas as-is
+        self._openai_tools = [convert_to_openai_tool(tool) for tool in self.tools]
+        self.tools_by_name = {
+            openai_tool["function"]["name"]: tool for tool, openai_tool in zip(self.tools, self._openai_tools)
+        }
 
-        if os.environ.get("OPENAI_API_KEY"):
+        if _HAS_OPENAI_KEY:
             self.model = self._set_openai_model(output_schema)
-        elif os.environ.get("GOOGLE_API_KEY"):
+        elif _HAS_GOOGLE_KEY:
             self.model = self._set_gemini_model(output_schema)
         else:
             self.model = self._set_local_model(output_schema)
@@ -191,7 +350,7 @@ class Model:
             ChatOpenAI: OpenAI model object.
         """
         model = ChatOpenAI(model = settings.llm_model_name)
-        model = model.bind_tools(self.tools)
+        model = model.bind_tools(self._openai_tools)
 
         if output_schema: model = model.with_structured_output(output_schema)
         return model
@@ -207,7 +366,7 @@ class Model:
             ChatGoogleGenerativeAI: Google Gemini model object.
         """
         model = ChatGoogleGenerativeAI(model = settings.llm_model_name)
-        model = model.bind_tools(self.tools)
+        model = model.bind_tools(self._openai_tools)
 
         if output_schema: model = model.with_structured_output(output_schema)
         return model
@@ -223,7 +382,7 @@ class Model:
             LocalModel: Local model object.
         """
         model = LocalModel(model = settings.llm_model_name)
-        model = model.bind_tools(self.tools)
+        model = model.bind_tools(self._openai_tools)
 
         if output_schema: model = model.with_structured_output(output_schema)
         return model
@@ -1,11 +1,14 @@
 import json
+from functools import lru_cache
+from threading import Lock
 from .llms import Model
 from .schemas import InterviewState, QuestionsSchema, EvaluationSchema, ReportingSchema
 from .prompts import INTERVIEWBOT_PROMPT, REPORTING_PROMPT, REPORTING_PROMPT_MAP, TOON_PROMPT
-from .tools import search_internet, generate_csv_tool, generate_pdf_tool, call_api_tool, user_tools
+from .tools import generate_csv_tool, generate_pdf_tool, call_api_tool, _search_tool, _user_tools
 from .utilities import prepare_llm_input
 from .settings import settings
 from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.prebuilt import ToolNode
 from langgraph.types import interrupt
 
@@ -14,14 +17,81 @@ from langgraph.types import interrupt
 questioner_model = Model(tools = [], output_schema = QuestionsSchema)
 evaluator_model = Model(tools = [], output_schema = EvaluationSchema)
 reporting_model = Model(tools = [], output_schema = ReportingSchema)
-questioner_tools_operator = Model(tools = [search_internet, *user_tools])
-evaluator_tools_operator = Model(tools = user_tools)
-reporting_tools_operator = Model(tools = [generate_csv_tool, generate_pdf_tool, call_api_tool, *user_tools])
 
 
-# Graph Node Operators/Functions
-execution_tool_node = ToolNode([search_internet, *user_tools])
-reporting_tool_node = ToolNode([generate_csv_tool, generate_pdf_tool, call_api_tool, *user_tools])
+# Tool bound models and tool nodes by name, built on first use so importing the graph doesn't
+# create the search client or execute the user's tools file
+_TOOL_OPERATOR_BUILDERS = {
+    "questioner": lambda: Model(tools = [_search_tool(), *_user_tools()]),
+    "evaluator": lambda: Model(tools = _user_tools()),
+    "reporting": lambda: Model(tools = [generate_csv_tool, generate_pdf_tool, call_api_tool, *_user_tools()]),
+    "execution_tools": lambda: ToolNode([_search_tool(), *_user_tools()]),
+    "reporting_tools": lambda: ToolNode([generate_csv_tool, generate_pdf_tool, call_api_tool, *_user_tools()])
+}
+_tool_operators = {}
+_tool_operators_lock = Lock()
+
+
+# Phase based routing map, phases not listed here are routed to the perception node
+_PHASE_ROUTES = {
+    "reporting": "reporting_perception_node",
+    "introduction": "candidate_information_collection_node",
+    "q&a": "answer_collection_node",
+    "evaluation": "evaluation_node"
+}
+
+# Candidate information collected during introduction, in order, with the prompt shown for each field
+_REQUIRED_FIELDS = (
+    ("name", "Please enter your full name"),
+    ("role", "Job role you want to interview for"),
+    ("companies", "Please enter comma separated names of companies you prefer")
+)
+
+
+# InterviewBot Helpers
+def _tool_operator(name: str) -> "Model | ToolNode":
+    """
+    Get a tool bound model or tool node, built once per process. Building is serialized so
+    concurrent first calls don't load a local model's weights twice.
+
+    Args:
+        name (str): Key of the operator in _TOOL_OPERATOR_BUILDERS.
+
+    Returns:
+        Model | ToolNode: Shared tool bound model or tool node.
+    """
+    operator = _tool_operators.get(name)
+    if operator is not None: return operator
+
+    with _tool_operators_lock:
+        if name not in _tool_operators: _tool_operators[name] = _TOOL_OPERATOR_BUILDERS[name]()
+        return _tool_operators[name]
+
+@lru_cache(maxsize=64)
+def _format_interviewbot_prompt(
+    role: str, companies: str, time_frame: str, no_of_questions: str, questions_type: str
+) -> str:
+    """
+    Format the interviewbot system prompt, memoized since the inputs stay the same for an interview.
+    Inputs are passed as strings, which keeps them hashable and formats them the same way.
+
+    Args:
+        role (str): Job role of the candidate.
+        companies (str): Comma separated names of preferred companies.
+        time_frame (str): Time limit for each question in minutes.
+        no_of_questions (str): Number of questions to ask.
+        questions_type (str): Type of questions to ask.
+
+    Returns:
+        str: Formatted system prompt.
+    """
+    return INTERVIEWBOT_PROMPT.format(
+        role=role,
+        companies=companies,
+        time_frame=time_frame,
+        no_of_questions=no_of_questions,
+        questions_type=questions_type
+    )
 
 
 # InterviewBot Functions
@@ -41,15 +111,13 @@ def candidate_information_collection_function(state: InterviewState) -> dict:
     user_information = state.get("candidate_information", {})
     phase = "introduction"
 
-    if "name" not in user_information:
-        user_information["name"] = interrupt("Please enter your full name")
-    elif "role" not in user_information:
-        user_information["role"] = interrupt("Job role you want to interview for")
-    elif "companies" not in user_information:
-        user_information["companies"] = interrupt(
-            "Please enter comma separated names of companies you prefer"
-        )
-        phase = "execution"
+    for field, prompt in _REQUIRED_FIELDS:
+        if field in user_information: continue
+
+        user_information[field] = interrupt(prompt)
+        # Introduction ends once the last field is collected
+        if field == _REQUIRED_FIELDS[-1][0]: phase = "execution"
+        break
 
     return {
         "messages": [HumanMessage(json.dumps(user_information))],
@@ -69,7 +137,7 @@ def question_generation_function(state: InterviewState) -> dict:
     """
     try:
         messages = state["messages"]
-        questions_data = questioner_tools_operator.model.invoke(prepare_llm_input(messages))
+        questions_data = _tool_operator("questioner").model.invoke(prepare_llm_input(messages))
 
         if hasattr(questions_data, "tool_calls") and len(questions_data.tool_calls) > 0:
             return {"messages": [questions_data]}
@@ -77,12 +145,25 @@ def question_generation_function(state: InterviewState) -> dict:
             messages.append(questions_data)
 
         questions = questioner_model.model.invoke(prepare_llm_input(messages))
-        questions_json = questions.model_dump_json(indent = 2)
+        questions_json = questions.model_dump_json()
 
         return {"messages": [AIMessage(questions_json)], "questions": questions.questions}
     except Exception as ex:
         return {"messages": [AIMessage(f"Error while generating questions: {str(ex)}")]}
 
+def execution_tool_function(state: InterviewState, config: RunnableConfig) -> dict:
+    """
+    Execute the tools called while generating questions.
+    
+    Args:
+        state (InterviewState): Current state of the interview.
+        config (RunnableConfig): Graph run configuration, passed on to the tool node.
+    
+    Returns:
+        dict: Updated state of the interview.
+    """
+    return _tool_operator("execution_tools").invoke(state, config)
+
 def answer_collection_function(state: InterviewState) -> dict:
     """
     Collect answers from the candidate, one question at a time.
@@ -94,16 +175,17 @@ def answer_collection_function(state: InterviewState) -> dict:
         dict: Updated state of the interview.
     """
     questions = state["questions"]
-    answers = state.get("answers", [])
+    # Copy once so the checkpointed state is not mutated while the node waits on interrupt
+    answers = list(state.get("answers", []))
     question = questions[len(answers)]
-    answer = {"question": question.question, "answer": interrupt(question)}
+    answers.append({"question": question.question, "answer": interrupt(question)})
 
-    if len(answers) + 1 < len(questions):
-        return {"answers": answers + [answer], "phase": "q&a"}
+    if len(answers) < len(questions):
+        return {"answers": answers, "phase": "q&a"}
     else:
         return {
-            "messages": [HumanMessage(json.dumps(answers + [answer]))],
-            "answers": answers + [answer],
+            "messages": [HumanMessage(json.dumps(answers))],
+            "answers": answers,
             "phase": "evaluation"
         }
 
@@ -120,7 +202,7 @@ def evaluation_function(state: InterviewState) -> dict:
     try:
         messages = state["messages"]
         evaluation = evaluator_model.model.invoke(prepare_llm_input(messages))
-        evaluation_json = evaluation.model_dump_json(indent = 2)
+        evaluation_json = evaluation.model_dump_json()
 
         return {"messages": [AIMessage(evaluation_json)]}
     except Exception as ex:
@@ -139,16 +221,27 @@ def interview_perception_function(state: InterviewState) -> dict:
     """
     rules = state["rules"]
     user_information = state["candidate_information"]
-    system_prompt = SystemMessage(INTERVIEWBOT_PROMPT.format(
-        role=user_information["role"],
-        companies=user_information["companies"],
-        time_frame=rules.get("time_frame"),
-        no_of_questions=rules.get("no_of_questions"),
-        questions_type=rules.get("questions_type")
-    ))
+    # Custom rules may hold lists or numbers, str() matches what format would write for them
+    system_prompt = SystemMessage(_format_interviewbot_prompt(*map(str, (
+        user_information["role"],
+        user_information["companies"],
+        rules.get("time_frame"),
+        rules.get("no_of_questions"),
+        rules.get("questions_type")
+    ))))
+
+    messages = state["messages"]
 
-    if system_prompt: state["messages"].insert(0, system_prompt)
-    if settings.use_toon_formatting: state["messages"].insert(1, SystemMessage(TOON_PROMPT))
+    # System prompt is already part of the conversation, avoid duplicating it on re-visits
+    if any(
+        isinstance(message, SystemMessage) and message.content == system_prompt.content
+        for message in messages
+    ): return state
+
+    # Prepend all system messages with a single list shift
+    system_messages = [system_prompt]
+    if settings.use_toon_formatting: system_messages.append(SystemMessage(TOON_PROMPT))
+    messages[:0] = system_messages
 
     return state
 
@@ -163,11 +256,7 @@ def phase_router_function(state: InterviewState) -> str:
     Returns:
         str: Name of the node to be executed.
     """
-    if state.get("phase") == "reporting": return "reporting_perception_node"
-    elif state.get("phase") == "introduction": return "candidate_information_collection_node"
-    elif state.get("phase") == "q&a": return "answer_collection_node"
-    elif state.get("phase") == "evaluation": return "evaluation_node"
-    else: return "perception_node"
+    return _PHASE_ROUTES.get(state.get("phase"), "perception_node")
 
 def reporting_function(state: InterviewState) -> dict:
     """
@@ -181,7 +270,7 @@ def reporting_function(state: InterviewState) -> dict:
     """
     try:
         messages = state["messages"]
-        response_data = reporting_tools_operator.model.invoke(prepare_llm_input(messages))
+        response_data = _tool_operator("reporting").model.invoke(prepare_llm_input(messages))
 
         if hasattr(response_data, "tool_calls") and len(response_data.tool_calls) > 0:
             return {"messages": [response_data]}
@@ -189,12 +278,25 @@ def reporting_function(state: InterviewState) -> dict:
             messages.append(response_data)
 
         response = reporting_model.model.invoke(prepare_llm_input(messages))
-        response_json = response.model_dump_json(indent = 2)
+        response_json = response.model_dump_json()
 
         return {"messages": [AIMessage(response_json)]}
     except Exception as ex:
         return {"messages": [AIMessage(f"Error while generating questions: {str(ex)}")]}
 
+def reporting_tool_function(state: InterviewState, config: RunnableConfig) -> dict:
+    """
+    Execute the tools called while generating reports.
+    
+    Args:
+        state (InterviewState): Current state of the interview.
+        config (RunnableConfig): Graph run configuration, passed on to the tool node.
+    
+    Returns:
+        dict: Updated state of the interview.
+    """
+    return _tool_operator("reporting_tools").invoke(state, config)
+
 def reporting_perception_function(state: InterviewState) -> dict:
     """
     Collect all the information required by the Agent for reporting, from multiple sources and
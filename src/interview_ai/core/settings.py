@@ -1,4 +1,5 @@
 import os, json
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,6 +15,20 @@ class DatabaseName(Enum):
     MONGODB = "mongo"
     SQLITE = "sqlite"
 
+@lru_cache(maxsize=1)
+def _load_system_config(config_path: str) -> dict:
+    """
+    Load the system configurations from the config.json file, once per path.
+
+    Args:
+        config_path (str): Absolute path of the config.json file.
+
+    Returns:
+        dict: System configurations.
+    """
+    with open(config_path, "r") as config_file:
+        return json.load(config_file)
+
 class Settings(BaseSettings):
     """
     Settings class to load the system configurations and environment variables. 
@@ -26,6 +41,7 @@ class Settings(BaseSettings):
         database_uri (Optional[str]): Database URI.
         max_intro_questions (int): Maximum number of introduction questions.
         internet_search (str): Internet search tool name.
+        pdf_render_workers (int): Worker processes rendering pdfs, 0 renders in the calling process.
         database_name (DatabaseName): Database name.
         use_toon_formatting (bool): Use TOON formatting for LLM inputs.
     """
@@ -50,6 +66,7 @@ class Settings(BaseSettings):
 
     # TOOLS
     internet_search: str = Field(default="duckduckgo")
+    pdf_render_workers: int = Field(default=0)
 
     def __init__(self) -> None:
         """
@@ -65,12 +82,11 @@ class Settings(BaseSettings):
         config_path = os.path.join(root_dir, "interview_ai", "config.json")
         
         if os.path.exists(config_path):
-            with open(config_path, "r") as config_file:
-                system_config = json.load(config_file)
+            system_config = _load_system_config(config_path)
 
-                for config_key, config_value in system_config.items():
-                    if config_key == "comments": continue
-                    setattr(self, config_key, config_value)
+            for config_key, config_value in system_config.items():
+                if config_key == "comments": continue
+                setattr(self, config_key, config_value)
 
             self._validate_settings()
         else:
@@ -86,7 +102,8 @@ class Settings(BaseSettings):
             None
         """
         # CONFIGURATIONS VALIDATION
-        if self.storage_mode == StorageMode.DATABASE.value and self.database_uri is None:
+        # storage_mode holds the raw config value, normalize it before comparing
+        if StorageMode(self.storage_mode) == StorageMode.DATABASE and self.database_uri is None:
             raise ValueError("Database URI not found")
         elif not self.llm_model_name:
             raise ValueError("LLM MODEL NAME not found")
@@ -1,12 +1,46 @@
-import sqlite3, os, psycopg
-from pymongo import MongoClient
-from typing import Literal
+import sqlite3, warnings
+from functools import lru_cache
+from typing import Literal, TYPE_CHECKING
 from langgraph.checkpoint.sqlite import SqliteSaver
-from langgraph.checkpoint.mongodb import MongoDBSaver
-from langgraph.checkpoint.postgres import PostgresSaver
 from langgraph.checkpoint.memory import InMemorySaver
 from .settings import settings
 
+if TYPE_CHECKING:
+    from langgraph.checkpoint.mongodb import MongoDBSaver
+    from langgraph.checkpoint.postgres import PostgresSaver
+
+
+# SQLite connection tuning, WAL appends checkpoint writes instead of rewriting a rollback journal
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# MongoDB client pool, bounded so many-worker deployments don't hold idle connections
+_MONGO_CLIENT_OPTIONS = {
+    "maxPoolSize": 50,
+    "minPoolSize": 5,
+    "maxIdleTimeMS": 60000,
+    "waitQueueTimeoutMS": 2000,
+    "serverSelectionTimeoutMS": 3000,
+    "connectTimeoutMS": 3000,
+    "socketTimeoutMS": 15000,
+    "retryWrites": True,
+    # Checkpoint blobs compress well, pymongo skips compressors whose package isn't installed
+    "compressors": "zstd,snappy,zlib",
+}
+
+# PostgreSQL connection pool, connections are configured the way PostgresSaver expects
+_POSTGRES_POOL_OPTIONS = {
+    "min_size": 2,
+    "max_size": 25,
+}
+# Seconds to wait at startup for the pool's first connections before giving up on the database
+_POSTGRES_OPEN_TIMEOUT = 10
+
 
 class Storage:
     """
@@ -28,38 +62,80 @@ class Storage:
         Returns:
             None
         """
-        if mode == "memory": self.storage = InMemorySaver()
-        else:
-            if database == "mongo": self.storage = self._set_mongo_storage()
-            elif database == "postgres": self.storage = self._set_postgres_storage()
-            else: self.storage = self._set_sqlite_storage()
+        self.storage = get_storage(mode, database)
     
-    def _set_sqlite_storage(self) -> SqliteSaver:
+    @staticmethod
+    def _set_sqlite_storage() -> SqliteSaver:
         """
         Set the storage to SQLite.
 
         Returns:
             SqliteSaver: SQLite storage object.
         """
-        connection = sqlite3.connect("interview_ai.db", check_same_thread=False)
+        # SqliteSaver owns transaction control, it relies on implicit transactions committed per cursor.
+        # timeout is the busy timeout, writers wait up to 30s on a locked database
+        connection = sqlite3.connect("interview_ai.db", check_same_thread=False, timeout=30)
+
+        for pragma in _SQLITE_PRAGMAS: connection.execute(pragma)
         return SqliteSaver(connection)
     
-    def _set_mongo_storage(self) -> MongoDBSaver:
+    @staticmethod
+    def _set_mongo_storage() -> "MongoDBSaver":
         """
         Set the storage to MongoDB.
 
         Returns:
             MongoDBSaver: MongoDB storage object.
         """
-        connection = MongoClient(settings.database_uri)
+        # Database drivers are imported only when their backend is selected
+        from pymongo import MongoClient
+        from langgraph.checkpoint.mongodb import MongoDBSaver
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Wire protocol compression")
+            connection = MongoClient(settings.database_uri, **_MONGO_CLIENT_OPTIONS)
         return MongoDBSaver(client=connection)
     
-    def _set_postgres_storage(self) -> PostgresSaver:
+    @staticmethod
+    def _set_postgres_storage() -> "PostgresSaver":
         """
         Set the storage to PostgreSQL.
 
         Returns:
             PostgresSaver: PostgreSQL storage object.
         """
-        connection = psycopg.connect(settings.database_uri)
-        return PostgresSaver(connection)
+        from psycopg.rows import dict_row
+        from psycopg_pool import ConnectionPool
+        from langgraph.checkpoint.postgres import PostgresSaver
+
+        connection_pool = ConnectionPool(
+            settings.database_uri,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+            open=False,
+            **_POSTGRES_POOL_OPTIONS
+        )
+        # Wait for min_size connections so an unreachable database raises PoolTimeout here,
+        # not on the first checkpoint
+        connection_pool.open(wait=True, timeout=_POSTGRES_OPEN_TIMEOUT)
+        return PostgresSaver(connection_pool)
+
+
+@lru_cache(maxsize=None)
+def get_storage(
+    mode: Literal["memory", "database"],
+    database: Literal["sqlite", "mongo", "postgres"] = "sqlite"
+) -> "InMemorySaver | SqliteSaver | MongoDBSaver | PostgresSaver":
+    """
+    Build the checkpointer for a storage mode and database, once per process.
+
+    Args:
+        mode (Literal["memory", "database"]): Storage mode.
+        database (Literal["sqlite", "mongo", "postgres"]): Database type.
+    
+    Returns:
+        InMemorySaver | SqliteSaver | MongoDBSaver | PostgresSaver: Shared checkpointer object.
+    """
+    if mode == "memory": return InMemorySaver()
+    if database == "mongo": return Storage._set_mongo_storage()
+    if database == "postgres": return Storage._set_postgres_storage()
+    return Storage._set_sqlite_storage()
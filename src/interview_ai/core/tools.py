@@ -1,67 +1,556 @@
-import pandas, os, requests
-from weasyprint import HTML
+import csv, io, os, re, sys, tempfile, threading, importlib, mimetypes, requests, multiprocessing
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from itertools import islice, repeat, zip_longest
 from .prompts import CSV_PROMPT, PDF_PROMPT, API_PROMPT
 from .settings import settings
 from .utilities import fetch_user_tools
-from langchain_core.tools import StructuredTool
-from langchain_community.tools import DuckDuckGoSearchResults
-from langchain_community.tools.bing_search import BingSearchResults
-from langchain_community.utilities import BingSearchAPIWrapper
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.tools.base import create_schema_from_function
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 
+# Shared HTTP session so API tool calls reuse pooled keep-alive connections
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # The last retried response is returned, so raise_for_status reports its status and body
+    max_retries=Retry(
+        total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False
+    )
+)
+_HTTP.mount("http://", _HTTP_ADAPTER)
+_HTTP.mount("https://", _HTTP_ADAPTER)
+# Streamed multipart uploads can only be read once, so they go through a session that never retries
+_HTTP_UPLOAD = requests.Session()
+_HTTP_UPLOAD_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+_HTTP_UPLOAD.mount("http://", _HTTP_UPLOAD_ADAPTER)
+_HTTP_UPLOAD.mount("https://", _HTTP_UPLOAD_ADAPTER)
+# Calls come from different interviews, so the sessions never store cookies a response sets
+_HTTP.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_HTTP_UPLOAD.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+# (connect, read) timeout in seconds for API tool calls, uploads get longer to send their attachments
+_HTTP_TIMEOUT = (3.05, 30)
+_HTTP_UPLOAD_TIMEOUT = (3.05, 60)
 
-def generate_csv_file(data: dict, candidate_name: str = "Interview AI") -> dict:
+# Heavy optional modules, imported on first attribute access through __getattr__
+_LAZY_IMPORTS = {
+    "pandas": ("pandas", None),
+    "HTML": ("weasyprint", "HTML"),
+}
+# Linked print_format.bundle stylesheets in pdf templates, the browser print bundle only slows down
+# weasyprint's css parsing. Any other stylesheet is kept, the report may depend on it
+_BUNDLE_LINK_RE = re.compile(
+    r"""<link\b(?=[^>]*\brel=["']?stylesheet\b)(?=[^>]*\bhref=["']?[^"'\s>]*\bprint_format\.bundle\b)[^>]*>""",
+    re.IGNORECASE
+)
+# Seconds to wait for a remote image or stylesheet referenced by a pdf template
+_PDF_FETCH_TIMEOUT = 5
+# This module, so lazily imported names resolve through __getattr__ from inside functions
+_this = sys.modules[__name__]
+
+
+class _ImageCache(OrderedDict):
+    """
+    Weasyprint image cache reused across the pdfs a thread renders, least recently used images
+    are dropped between renders.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize the image cache.
+
+        Args:
+            maxsize (int): Number of entries kept after each render.
+        
+        Returns:
+            None
+        """
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def trim(self) -> None:
+        """
+        Drop least recently used entries above maxsize. Only called between renders
+        because weasyprint reads back image data it cached earlier in the same render.
+
+        Returns:
+            None
+        """
+        while len(self) > self.maxsize: self.popitem(last=False)
+
+
+# One image cache per rendering thread, a render trimming a shared cache could evict images
+# a concurrent render stored and hasn't read back yet
+_IMAGE_CACHES = threading.local()
+
+# Seconds to wait for a pdf render, and renders per worker before it is replaced to release memory
+_PDF_RENDER_TIMEOUT = 120
+_PDF_TASKS_PER_WORKER = 20
+
+# Row count above which csv output is written and flushed in chunks
+_CSV_LARGE_ROWS = 10_000
+_CSV_CHUNK_ROWS = 50_000
+
+
+def generate_csv_file(data: dict, candidate_name: str = "Interview AI", in_memory: bool = False) -> dict:
     candidate_name = candidate_name.strip().replace(" ", "_")
-    root_dir = os.getcwd()
-    csv_path = os.path.join(root_dir, "interview_ai", f"{candidate_name}.csv")
-    pandas.DataFrame(data).to_csv(csv_path, index=False)
-    return {
-        "label": "Download CSV File",
-        "file_path":csv_path,
-        "file_name":f"{candidate_name}.csv",
-        "mime":"text/csv"
-    }
+    file_details = {"label": "Download CSV File", "file_name": f"{candidate_name}.csv", "mime": "text/csv"}
+
+    if in_memory:
+        buffer = io.StringIO(newline="")
+        _write_csv(data, buffer)
+        return {**file_details, "bytes": buffer.getvalue().encode("utf-8")}
+
+    csv_path = os.path.join(_output_dir(), f"{candidate_name}.csv")
+
+    with _atomic_write(csv_path) as temp_path:
+        with open(temp_path, "w", newline="", buffering=1 << 20) as file: _write_csv(data, file)
+    return {**file_details, "file_path": csv_path}
+
+def _write_csv(data: dict, file: io.TextIOBase) -> None:
+    """
+    Write column oriented data or a DataFrame as csv, large data is written in chunks.
+    Plain dict values are written as given, unlike pandas which writes 90 as 90.0
+    in a column that also holds floats or missing values.
+
+    Args:
+        data (dict): Column name to column values mapping, or a pandas DataFrame.
+        file (io.TextIOBase): Text file the csv is written to.
+    
+    Returns:
+        None
+    """
+    # Dict valued columns are aligned on their keys, which only pandas does
+    if not _is_dataframe(data) and any(isinstance(value, dict) for value in data.values()):
+        data = _this.pandas.DataFrame(data)
+
+    if _is_dataframe(data):
+        data = _flatten_dataframe(data)
+        chunksize = _CSV_CHUNK_ROWS if len(data) > _CSV_LARGE_ROWS else None
+        data.to_csv(file, index=False, chunksize=chunksize)
+        return
 
-def generate_pdf_file(template: str, candidate_name: str = "Interview AI") -> dict:
+    # Same line endings as DataFrame.to_csv
+    writer = csv.DictWriter(file, fieldnames=list(data.keys()), lineterminator="\n")
+    writer.writeheader()
+    row_count = _column_length(data)
+    rows = _rows_from_columns(data, row_count)
+
+    if row_count <= _CSV_LARGE_ROWS: writer.writerows(rows)
+    else:
+        while chunk := list(islice(rows, _CSV_CHUNK_ROWS)):
+            writer.writerows(chunk)
+            file.flush()
+
+@lru_cache(maxsize=1)
+def _output_dir() -> str:
+    """
+    Get the directory generated files are written to, created on first use.
+
+    Returns:
+        str: Path of the interview_ai directory in the working directory.
+    """
+    output_dir = os.path.join(os.getcwd(), "interview_ai")
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+@contextmanager
+def _atomic_write(path: str):
+    """
+    Provide a temporary file next to path that replaces path once the block succeeds,
+    so readers and concurrent writers never see a partially written file.
+
+    Args:
+        path (str): Final path of the file.
+    
+    Returns:
+        Iterator[str]: Path of the temporary file to write to.
+    """
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), suffix=os.path.splitext(path)[1]
+    )
+    os.close(file_descriptor)
+
+    try:
+        yield temp_path
+        # mkstemp files are owner-only, generated files keep the usual permissions
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path): os.remove(temp_path)
+        raise
+
+def _is_dataframe(data: object) -> bool:
+    """
+    Check for a pandas DataFrame without importing pandas for plain dict data.
+
+    Args:
+        data (object): Data passed to the csv tool.
+    
+    Returns:
+        bool: True if data is a pandas DataFrame.
+    """
+    if type(data).__module__.split(".")[0] != "pandas": return False
+    return isinstance(data, _this.pandas.DataFrame)
+
+def _flatten_dataframe(data: "pandas.DataFrame") -> "pandas.DataFrame":
+    """
+    Drop a MultiIndex or named index and join MultiIndex columns, keeping to_csv on its fast path.
+
+    Args:
+        data (pandas.DataFrame): DataFrame passed to the csv tool.
+    
+    Returns:
+        pandas.DataFrame: DataFrame with a default index and flat column names.
+    """
+    pandas = _this.pandas
+
+    if isinstance(data.index, pandas.MultiIndex) or data.index.name is not None:
+        data = data.reset_index(drop=True)
+    if isinstance(data.columns, pandas.MultiIndex):
+        data = data.copy(deep=False)
+        data.columns = ["_".join(map(str, column)).strip("_") for column in data.columns]
+    return data
+
+def _column_length(data: dict) -> int:
+    """
+    Get the row count of column oriented data, the length of its longest column.
+
+    Args:
+        data (dict): Column name to column values mapping.
+    
+    Returns:
+        int: Number of values in the longest list or tuple column, 1 when every column is a scalar.
+    """
+    return max((len(value) for value in data.values() if isinstance(value, (list, tuple))), default=1)
+
+def _rows_from_columns(data: dict, row_count: int):
+    """
+    Turn column oriented data into csv rows, repeating scalar values on every row like pandas
+    and padding shorter columns with empty values.
+
+    Args:
+        data (dict): Column name to column values mapping.
+        row_count (int): Number of rows, the length of the longest column.
+    
+    Returns:
+        Iterator[dict]: One dict per csv row.
+    """
+    fieldnames = list(data.keys())
+    columns = (
+        value if isinstance(value, (list, tuple)) else repeat(value, row_count) for value in data.values()
+    )
+
+    for row in zip_longest(*columns, fillvalue=""): yield dict(zip(fieldnames, row))
+
+def generate_pdf_file(template: str, candidate_name: str = "Interview AI", in_memory: bool = False) -> dict:
     candidate_name = candidate_name.strip().replace(" ", "_")
-    root_dir = os.getcwd()
-    pdf_path = os.path.join(root_dir, "interview_ai", f"{candidate_name}.pdf")
-    HTML(string = template).write_pdf(pdf_path)
+    file_details = {"label": "Download PDF File", "file_name": f"{candidate_name}.pdf", "mime": "application/pdf"}
+    template = _BUNDLE_LINK_RE.sub("", template)
+
+    if in_memory: return {**file_details, "bytes": _run_pdf_render(template)}
+
+    pdf_path = os.path.join(_output_dir(), f"{candidate_name}.pdf")
+    _run_pdf_render(template, pdf_path)
+    return {**file_details, "file_path": pdf_path}
+
+def _run_pdf_render(template: str, pdf_path: str = None) -> bytes | None:
+    """
+    Render a pdf in the calling process, or in the worker pool when pdf_render_workers is set.
+
+    Args:
+        template (str): HTML template of the pdf.
+        pdf_path (str, optional): Path to write the pdf to. Defaults to None, returning the bytes.
+    
+    Returns:
+        bytes | None: Rendered pdf when no pdf_path is given.
+    """
+    if settings.pdf_render_workers <= 0: return _render_pdf(template, pdf_path)
+
+    return _get_pdf_pool().submit(_render_pdf, template, pdf_path).result(timeout=_PDF_RENDER_TIMEOUT)
+
+def open_generated_file(file_details: dict) -> dict:
+    """
+    Open a file returned by the csv or pdf generator as a read-only descriptor, so a server
+    can stream it with os.sendfile instead of reading it into memory. The caller owns the
+    descriptor and must close it. Where os.sendfile isn't available the details are returned as is.
+
+    Args:
+        file_details (dict): Response of generate_csv_file or generate_pdf_file with a file_path.
+    
+    Returns:
+        dict: file_details with "fd" and "size" added when sendfile is supported.
+    """
+    if not hasattr(os, "sendfile"): return file_details
+
+    file_descriptor = os.open(file_details["file_path"], os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    return {**file_details, "fd": file_descriptor, "size": os.fstat(file_descriptor).st_size}
+
+@lru_cache(maxsize=1)
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Create the worker pool pdfs are rendered in when pdf_render_workers is set, so rendering
+    doesn't hold the GIL of the server process. Spawned workers re-import the host's __main__,
+    which must keep its server start and client setup under an `if __name__ == "__main__":` guard.
+
+    Returns:
+        ProcessPoolExecutor: Shared pdf rendering pool.
+    """
+    # Workers are spawned, forking a threaded server process is unsafe
+    options = {"max_workers": settings.pdf_render_workers, "mp_context": multiprocessing.get_context("spawn")}
+    if sys.version_info >= (3, 11): options["max_tasks_per_child"] = _PDF_TASKS_PER_WORKER
+    return ProcessPoolExecutor(**options)
+
+@lru_cache(maxsize=1)
+def _pdf_resources() -> dict:
+    """
+    Create the weasyprint objects shared by every pdf the process renders: the font configuration,
+    a pre-parsed base stylesheet and a url fetcher using the shared HTTP session. Renders only read
+    them, so inline renders on concurrent server threads share them too.
+
+    Returns:
+        dict: font_config, stylesheets and url_fetcher for weasyprint.
+    """
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+    from weasyprint.urls import URLFetcher, URLFetcherResponse
+
+    class SessionURLFetcher(URLFetcher):
+        """
+        Weasyprint url fetcher that loads http(s) resources through the shared HTTP session.
+        """
+
+        def fetch(self, url: str, headers: dict = None) -> URLFetcherResponse:
+            """
+            Fetch a resource referenced by a pdf template.
+
+            Args:
+                url (str): Absolute url of the resource.
+                headers (dict): Additional request headers.
+            
+            Returns:
+                URLFetcherResponse: Fetched resource.
+            """
+            if not url.lower().startswith(("http://", "https://")): return super().fetch(url, headers)
+
+            response = _HTTP.get(url, headers=headers, timeout=_PDF_FETCH_TIMEOUT)
+            response.raise_for_status()
+            # requests has already decoded the body
+            response_headers = {
+                key: value for key, value in response.headers.items() if key.lower() != "content-encoding"
+            }
+            return URLFetcherResponse(response.url, response.content, response_headers, response.status_code)
+
+    font_config = FontConfiguration()
     return {
-        "label": "Download PDF File",
-        "file_path":pdf_path,
-        "file_name":f"{candidate_name}.pdf",
-        "mime":"application/pdf"
+        "font_config": font_config,
+        "stylesheets": [CSS(string="@page{size:A4;margin:1cm}", font_config=font_config)],
+        "url_fetcher": SessionURLFetcher()
+    }
+
+@lru_cache(maxsize=64)
+def _parse_template(template: str) -> "HTML":
+    """
+    Parse an html template once per process, reports often repeat the same template.
+    The parsed document is only read while rendering, so concurrent renders can share it.
+
+    Args:
+        template (str): HTML template of the pdf.
+    
+    Returns:
+        HTML: Parsed weasyprint document, reusable across renders.
+    """
+    return _this.HTML(string = template, url_fetcher = _pdf_resources()["url_fetcher"])
+
+def _image_cache() -> _ImageCache:
+    """
+    Get the image cache of the calling thread, created on first use.
+
+    Returns:
+        _ImageCache: Image cache used by the pdfs this thread renders.
+    """
+    if not hasattr(_IMAGE_CACHES, "cache"): _IMAGE_CACHES.cache = _ImageCache(maxsize=128)
+    return _IMAGE_CACHES.cache
+
+def _render_pdf(template: str, pdf_path: str = None) -> bytes | None:
+    """
+    Render an html template to a pdf, in the calling thread of the server process by default or in
+    a pdf pool worker when pdf_render_workers is set. Concurrent renders each use their thread's image cache.
+
+    Args:
+        template (str): HTML template of the pdf.
+        pdf_path (str): Path the pdf is written to, if not given the pdf is returned as bytes.
+    
+    Returns:
+        bytes | None: PDF bytes when no pdf_path is given.
+    """
+    resources = _pdf_resources()
+    document = _parse_template(template)
+    image_cache = _image_cache()
+    options = {
+        "stylesheets": resources["stylesheets"],
+        "font_config": resources["font_config"],
+        "cache": image_cache,
+        "optimize_images": True,
+        "jpeg_quality": 80,
+        "uncompressed_pdf": False
     }
 
+    try:
+        if pdf_path is None: return document.write_pdf(**options)
+
+        with _atomic_write(pdf_path) as temp_path: document.write_pdf(temp_path, **options)
+    finally:
+        image_cache.trim()
+
 def call_api_endpoint(api_details: dict) -> dict:
+    files_to_attach = {}
+
     try:
-        files_to_attach = {}
+        headers = dict(api_details.get("headers") or {})
+        data = api_details.get("body", {})
+        timeout = _HTTP_TIMEOUT
+        session = _HTTP
+        attachment = api_details.get("attachment") or {}
+
+        # Multipart fields are named by the attachment keys, a bare path or list of paths can't be sent
+        if not isinstance(attachment, dict):
+            return {"error": "Attachments must be a mapping of field names to file paths"}
 
-        for name, path in api_details.get("attachment", {}).items():
+        for name, path in attachment.items():
             files_to_attach[name] = open(path, "rb")
+
+        if files_to_attach:
+            # Multipart fields are built from a key-value body, a raw string body can't be combined with files
+            if data and not isinstance(data, dict):
+                return {"error": "Attachments require the body to be a key-value mapping"}
+
+            # Nested mappings have no form field encoding
+            if any(isinstance(value, dict) for value in (data or {}).values()):
+                return {"error": "Attachments require body values to be scalars or lists of scalars"}
+
+            # Stream the multipart body from the open files instead of building it in memory.
+            # Like requests' form encoding, list values repeat their field and None values are left out
+            fields = [
+                (key, str(item))
+                for key, value in (data or {}).items()
+                for item in (value if isinstance(value, (list, tuple)) else [value])
+                if item is not None
+            ]
+            for name, file in files_to_attach.items():
+                mime = mimetypes.guess_type(file.name)[0] or "application/octet-stream"
+                fields.append((name, (os.path.basename(file.name), file, mime)))
+
+            data = MultipartEncoder(fields=fields)
+            headers = {
+                key: value for key, value in headers.items() if key.lower() != "content-type"
+            }
+            headers["Content-Type"] = data.content_type
+            timeout = _HTTP_UPLOAD_TIMEOUT
+            session = _HTTP_UPLOAD
         
-        response = requests.request(
+        response = session.request(
             method = api_details.get("method", "POST"),
             url = api_details.get("endpoint", ""),
-            headers = api_details.get("headers", {}),
-            data = api_details.get("body", {}),
-            files = files_to_attach
+            headers = headers,
+            data = data,
+            timeout = timeout
         )
         response.raise_for_status()
-        return response.json()
+
+        if response.headers.get("Content-Type", "").startswith("application/json"):
+            return response.json()
+        return {"text": response.text}
     except requests.exceptions.HTTPError:
         return {"error": f"Error {response.status_code}: {response.text}"}
-    except Exception as ex:
-        return {"error": "Failed to call API endpoint"}
+    except (requests.RequestException, OSError) as ex:
+        return {"error": str(ex)}
     finally:
         for name, file in files_to_attach.items():
             file.close()
 
+@lru_cache(maxsize=1)
+def _search_tool() -> BaseTool:
+    """
+    Create the internet search tool on first use, so importing this module doesn't build search clients.
+
+    Returns:
+        BaseTool: Bing search tool if configured, otherwise DuckDuckGo search tool.
+    """
+    if settings.internet_search == "bing":
+        from langchain_community.tools.bing_search import BingSearchResults
+        from langchain_community.utilities import BingSearchAPIWrapper
+
+        return BingSearchResults(api_wrapper=BingSearchAPIWrapper())
+
+    from langchain_community.tools import DuckDuckGoSearchResults
+    return DuckDuckGoSearchResults()
+
+def _user_tools() -> list:
+    """
+    Load the user defined tools on access, fetch_user_tools only re-executes the file after it changes.
+
+    Returns:
+        list: Tools from the user's interview_ai/tools.py file.
+    """
+    return fetch_user_tools()
+
+def __getattr__(name: str):
+    """
+    Resolve the search_internet and user_tools module attributes, and the pandas and
+    weasyprint HTML imports, lazily.
+
+    Args:
+        name (str): Attribute name.
+    
+    Returns:
+        Any: Search tool, user tools or the imported module attribute.
+    """
+    if name == "search_internet": return _search_tool()
+    if name == "user_tools": return _user_tools()
+    if name in _LAZY_IMPORTS:
+        module_name, attribute = _LAZY_IMPORTS[name]
+        value = importlib.import_module(module_name)
+        if attribute: value = getattr(value, attribute)
+
+        # Later lookups find the global directly
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Tools
-search_internet = BingSearchResults(api_wrapper=BingSearchAPIWrapper()) if (
-    settings.internet_search == "bing"
-) else DuckDuckGoSearchResults()
-generate_csv_tool = StructuredTool.from_function(generate_csv_file, description = CSV_PROMPT)
-generate_pdf_tool = StructuredTool.from_function(generate_pdf_file, description = PDF_PROMPT)
+# in_memory output is for direct callers, tool responses are read by the LLM so they always return a file path
+generate_csv_tool = StructuredTool.from_function(
+    generate_csv_file,
+    description = CSV_PROMPT,
+    args_schema = create_schema_from_function("generate_csv_file", generate_csv_file, filter_args = ["in_memory"])
+)
+generate_pdf_tool = StructuredTool.from_function(
+    generate_pdf_file,
+    description = PDF_PROMPT,
+    args_schema = create_schema_from_function("generate_pdf_file", generate_pdf_file, filter_args = ["in_memory"])
+)
 call_api_tool = StructuredTool.from_function(call_api_endpoint, description = API_PROMPT)
-user_tools = fetch_user_tools()
+
+__all__ = [
+    "generate_csv_file",
+    "generate_pdf_file",
+    "call_api_endpoint",
+    "open_generated_file",
+    "search_internet",
+    "generate_csv_tool",
+    "generate_pdf_tool",
+    "call_api_tool",
+    "user_tools"
+]
@@ -1,4 +1,6 @@
-import os, json, importlib
+import os, json, importlib, time
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from .schemas import InterviewState
 from .cache import cache
@@ -48,11 +50,25 @@ def load_interview_rules(format: str = "coding") -> dict:
     """
     root_dir = os.getcwd()
     json_path = os.path.join(root_dir, "interview_ai", "interview_rules.json")
+    interview_rules = _read_interview_rules(json_path, os.stat(json_path).st_mtime_ns)
+    
+    # Shallow copy so callers can't modify the cached rules
+    return dict(interview_rules.get(format, {}))
 
-    with open(json_path, "r") as file:
-        interview_rules = json.load(file)
+@lru_cache(maxsize=16)
+def _read_interview_rules(json_path: str, modified_at: int) -> dict:
+    """
+    Read and parse the interview_rules.json file, cached until the file is modified.
+
+    Args:
+        json_path (str): Path of the interview_rules.json file.
+        modified_at (int): Modification time of the file in nanoseconds, used as cache key.
     
-    return interview_rules.get(format, {})
+    Returns:
+        dict: All interview rules, keyed by format.
+    """
+    with open(json_path, "r") as file:
+        return json.load(file)
 
 def load_cache(thread_id: str, interviewbot: Any) -> dict:
     """
@@ -71,9 +87,10 @@ def load_cache(thread_id: str, interviewbot: Any) -> dict:
     if cached_data is None:
         config = {"configurable": {"thread_id": thread_id}}
         latest_graph_state = interviewbot.get_state(config)
+        created_at = latest_graph_state.created_at
         cached_data = {
             "last_message": {},
-            "last_updated": latest_graph_state.created_at,
+            "last_updated": datetime.fromisoformat(created_at).timestamp() if created_at else time.time(),
             "count": len(latest_graph_state.values.get("candidate_information", {})) + len(
                 latest_graph_state.values.get("answers", [])
             )
@@ -100,17 +117,32 @@ def fetch_user_tools() -> list:
     root_dir = os.getcwd()
     tools_path = os.path.join(root_dir, "interview_ai", "tools.py")
 
-    if not os.path.exists(tools_path): return []
+    try: modified_at = os.stat(tools_path).st_mtime_ns
+    except OSError: return []
 
+    return list(_load_user_tools(tools_path, modified_at))
+
+@lru_cache(maxsize=4)
+def _load_user_tools(tools_path: str, modified_at: int) -> tuple:
+    """
+    Execute the user's tools.py file and collect its tools, cached until the file is modified.
+
+    Args:
+        tools_path (str): Path of the tools.py file.
+        modified_at (int): Modification time of the file in nanoseconds, used as cache key.
+    
+    Returns:
+        tuple: User tools.
+    """
     try:
         spec = importlib.util.spec_from_file_location("user_tools", tools_path)
-        if spec is None or spec.loader is None: return []
+        if spec is None or spec.loader is None: return ()
         
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
-        return getattr(module, 'user_tools', [])
+        return tuple(getattr(module, 'user_tools', []))
     except Exception:
-        return []
+        return ()
 
 def prepare_llm_input(messages: list[BaseMessage]) -> list[BaseMessage]:
     """
@@ -2,7 +2,7 @@ from ..core.storage import Storage
 from ..core.schemas import InterviewState
 from ..core.operators import (
     interview_perception_function, candidate_information_collection_function, question_generation_function,
-    answer_collection_function, evaluation_function, execution_tool_node, reporting_function, reporting_tool_node,
+    answer_collection_function, evaluation_function, execution_tool_function, reporting_function, reporting_tool_function,
     phase_router_function, reporting_perception_function
 )
 from ..core.utilities import custom_tools_condition
@@ -29,14 +29,14 @@ graph.add_node(
     "answer_collection_node", answer_collection_function, retry_policy=RetryPolicy(max_attempts=3)
 )
 graph.add_node("evaluation_node", evaluation_function)
-graph.add_node("execution_tools", execution_tool_node)
+graph.add_node("execution_tools", execution_tool_function)
 graph.add_node("reporting_node", reporting_function)
 graph.add_node(
     "reporting_perception_node",
     reporting_perception_function,
     retry_policy=RetryPolicy(max_attempts=3)
 )
-graph.add_node("tools", reporting_tool_node)
+graph.add_node("tools", reporting_tool_function)
 
 # Graph Edges
 graph.add_edge(START, "candidate_information_collection_node")
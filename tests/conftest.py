@@ -3,42 +3,54 @@ Pytest configuration and fixtures for interview-ai tests.
 Sets up the required config files before tests run using the CLI setup.
 """
 import os
-import sys
 import shutil
-import atexit
+import hashlib
+import tempfile
 import importlib.util
+from io import StringIO
+from contextlib import redirect_stdout
+from filelock import FileLock
 
-# Setup config directory at module load time (before test collection)
+# Config directory created by the CLI setup in the working directory
 _test_interview_dir = os.path.join(os.getcwd(), "interview_ai")
-_cleanup_needed = False
+# Serializes setup across pytest-xdist workers sharing the working directory
+_setup_lock_path = os.path.join(
+    tempfile.gettempdir(),
+    f"interview_ai_setup_{hashlib.sha1(os.getcwd().encode()).hexdigest()[:12]}.lock"
+)
 
-if not os.path.isdir(_test_interview_dir):
-    # Import the CLI setup module directly to avoid triggering full package import
+
+def _run_cli_setup():
+    """Run the CLI setup, imported directly to avoid triggering full package import."""
     setup_path = os.path.join(
         os.path.dirname(os.path.dirname(__file__)),
         "src", "interview_ai", "cli", "setup.py"
     )
-    
+
     spec = importlib.util.spec_from_file_location("cli_setup", setup_path)
     cli_setup_module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(cli_setup_module)
-    
-    from io import StringIO
-    from contextlib import redirect_stdout
-    
+
     # Suppress output during setup
     with redirect_stdout(StringIO()):
-        try:
-            cli_setup_module.main()
-            _cleanup_needed = True
-        except FileExistsError:
-            pass  # Already exists, that's fine
+        cli_setup_module.main()
+
+def pytest_configure(config):
+    """
+    Setup config directory before test collection. Only one process runs the setup,
+    the controller under pytest-xdist runs before its workers and workers find it done.
+    """
+    config._interview_ai_cleanup = False
+
+    with FileLock(_setup_lock_path):
+        if os.path.isdir(_test_interview_dir): return
+
+        _run_cli_setup()
+        # Workers never own the directory, the controller removes it after they finish
+        config._interview_ai_cleanup = not hasattr(config, "workerinput")
 
-def _cleanup():
+def pytest_unconfigure(config):
     """Remove the test config directory after tests complete."""
-    global _cleanup_needed
-    if _cleanup_needed and os.path.isdir(_test_interview_dir):
-        shutil.rmtree(_test_interview_dir)
+    if not getattr(config, "_interview_ai_cleanup", False): return
 
-# Register cleanup to run when Python exits
-atexit.register(_cleanup)
+    if os.path.isdir(_test_interview_dir): shutil.rmtree(_test_interview_dir)
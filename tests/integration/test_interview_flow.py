@@ -6,9 +6,9 @@ import pytest
 import os
 import sys
 import json
+import time
 import importlib.util
 from unittest.mock import MagicMock, patch, PropertyMock
-from datetime import datetime, timezone
 
 
 # Helper to import modules directly
@@ -28,6 +28,14 @@ def _import_module(filename, module_name=None):
 _cache_module = _import_module("cache.py", "cache")
 SimpleCache = _cache_module.SimpleCache
 
+# Phase routes used by the inlined phase router, unlisted phases go to the perception node
+_ROUTES: dict[str, str] = {
+    "reporting": "reporting_node",
+    "introduction": "candidate_information_collection_node",
+    "q&a": "answer_collection_node",
+    "evaluation": "evaluation_node"
+}
+
 
 class MockInterrupt:
     """Mock interrupt object returned by LangGraph."""
@@ -118,7 +126,7 @@ class TestInterviewClientFlowMocked:
         # Simulate start
         cache.set(thread_id, {
             "last_message": {"text": "Please enter your full name", "type": "interrupt"},
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": time.time(),
             "count": 0
         })
         
@@ -171,7 +179,7 @@ class TestInterviewClientFlowMocked:
         # Simulate start (same as above, just checking it doesn't break)
         cache.set(thread_id, {
             "last_message": {"text": "Please enter your full name", "type": "interrupt"},
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": time.time(),
             "count": 0
         })
         
@@ -185,13 +193,11 @@ class TestInterviewClientFlowMocked:
 
     def test_answer_expiry_integration(self):
         """Test that answer expiry works correctly in the flow."""
-        from datetime import timedelta
-        
         cache = SimpleCache()
         thread_id = "test_expiry_integration"
         
         # Set up a cached state with old timestamp
-        old_time = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+        old_time = time.time() - 10 * 60
         cache.set(thread_id, {
             "last_message": {"text": "Enter your name", "type": "interrupt"},
             "last_updated": old_time,
@@ -202,9 +208,7 @@ class TestInterviewClientFlowMocked:
         cached = cache.get(thread_id)
         time_frame = 1  # 1 minute
         
-        if datetime.fromisoformat(cached["last_updated"]) < datetime.now(timezone.utc) - timedelta(
-            minutes=float(time_frame), seconds=float(5)
-        ):
+        if cached["last_updated"] < time.time() - (float(time_frame) * 60 + 5):
             # Answer would be expired
             user_message = ""
         else:
@@ -221,7 +225,7 @@ class TestInterviewClientFlowMocked:
         max_questions = 4  # 1 question + 3 intro
         cache.set(thread_id, {
             "last_message": {"text": "Final evaluation", "type": "text"},
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": time.time(),
             "count": 4
         })
         
@@ -285,23 +289,14 @@ class TestPhaseTransitions:
         """Test the phase router logic for different phases."""
         # Inline the phase router logic
         def phase_router(state):
-            phase = state.get("phase")
-            if phase == "reporting":
-                return "reporting_node"
-            elif phase == "introduction":
-                return "candidate_information_collection_node"
-            elif phase == "q&a":
-                return "answer_collection_node"
-            elif phase == "evaluation":
-                return "evaluation_node"
-            else:
-                return "perception_node"
+            return _ROUTES.get(state.get("phase"), "perception_node")
         
         assert phase_router({"phase": "introduction"}) == "candidate_information_collection_node"
         assert phase_router({"phase": "q&a"}) == "answer_collection_node"
         assert phase_router({"phase": "evaluation"}) == "evaluation_node"
         assert phase_router({"phase": "reporting"}) == "reporting_node"
         assert phase_router({}) == "perception_node"
+        assert phase_router({"phase": "unknown"}) == "perception_node"
 
     def test_candidate_info_collection_sequence(self):
         """Test the sequence of candidate information collection."""
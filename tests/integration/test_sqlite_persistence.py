@@ -5,10 +5,66 @@ Tests the Storage class with SQLite for interview state persistence.
 import pytest
 import os
 import sys
+import json
 import sqlite3
-import tempfile
-import importlib.util
-from unittest.mock import MagicMock, patch
+
+# Add src to python path to allow imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "src"))
+
+from interview_ai.core.cache import SimpleCache
+
+# orjson encodes noticeably faster when it is available, json otherwise. States are
+# stored as UTF-8 BLOBs, so SQLite does not revalidate the text on every bind
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    _dumps = lambda obj: json.dumps(obj).encode("utf-8")
+
+
+class _Msg:
+    """Minimal message stand-in, only the content attribute is read."""
+    __slots__ = ("content",)
+
+    def __init__(self, content):
+        self.content = content
+
+
+def _open_tuned(path, **kwargs):
+    """
+    Open a test connection with a WAL journal, NORMAL syncing and a 5s busy timeout.
+    Autocommit mode, batched writes open their own BEGIN IMMEDIATE transaction.
+    """
+    conn = sqlite3.connect(path, isolation_level=None, **kwargs)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA busy_timeout=5000;
+    """)
+    return conn
+
+
+@pytest.fixture(scope="module")
+def tuned_conn(tmp_path_factory):
+    """One tuned connection and schema shared by the module, tests use distinct thread_id prefixes."""
+    conn = _open_tuned(os.fspath(tmp_path_factory.mktemp("sqlite") / "interview_states.db"))
+    # Schema only, each test writes its own rows
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS interview_states (
+            thread_id TEXT PRIMARY KEY,
+            state_json BLOB,
+            phase TEXT,
+            candidate_name TEXT,
+            message_count INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_thread_cover ON interview_states(thread_id, candidate_name, phase);
+    ''')
+
+    yield conn
+
+    conn.close()
 
 
 class TestSQLitePersistence:
@@ -16,171 +72,144 @@ class TestSQLitePersistence:
 
     def test_sqlite_connection_and_table_creation(self):
         """Test that SQLite connection and tables can be created."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test_interview.db")
-            
-            # Create connection
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Create a simple checkpoints table (similar to LangGraph's schema)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS checkpoints (
-                    thread_id TEXT PRIMARY KEY,
-                    checkpoint_data TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            conn.commit()
-            
-            # Verify table exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='checkpoints'")
-            result = cursor.fetchone()
-            assert result is not None
-            assert result[0] == 'checkpoints'
-            
-            conn.close()
-
-    def test_state_persistence_and_retrieval(self):
+        # Only the schema is checked, nothing needs to reach disk
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        cursor = conn.cursor()
+        
+        # Create a simple checkpoints table (similar to LangGraph's schema)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                thread_id TEXT PRIMARY KEY,
+                checkpoint_data TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        ''')
+        
+        # Verify table exists
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='checkpoints'")
+        result = cursor.fetchone()
+        assert result is not None
+        assert result[0] == 'checkpoints'
+
+        # Rows are stored directly in the thread_id keyed btree
+        with pytest.raises(sqlite3.OperationalError):
+            cursor.execute("SELECT rowid FROM checkpoints")
+        
+        conn.close()
+
+    def test_tuned_connection_pragmas(self, tuned_conn):
+        """Test that tuned connections use WAL with relaxed syncing."""
+        conn = tuned_conn
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_state_persistence_and_retrieval(self, tuned_conn):
         """Test saving and retrieving interview state from SQLite."""
-        import json
+        conn = tuned_conn
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test_state.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Create table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS interview_states (
-                    thread_id TEXT PRIMARY KEY,
-                    state_json TEXT,
-                    phase TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Save state
-            thread_id = "test_thread_001"
-            state = {
-                "messages": [],
-                "phase": "introduction",
-                "candidate_information": {"name": "Test User"},
-                "rules": {"format": "short"}
-            }
-            
-            cursor.execute(
-                "INSERT OR REPLACE INTO interview_states (thread_id, state_json, phase) VALUES (?, ?, ?)",
-                (thread_id, json.dumps(state), state["phase"])
-            )
-            conn.commit()
-            
-            # Retrieve state
-            cursor.execute("SELECT state_json, phase FROM interview_states WHERE thread_id = ?", (thread_id,))
-            row = cursor.fetchone()
-            
-            assert row is not None
-            retrieved_state = json.loads(row[0])
-            assert retrieved_state["phase"] == "introduction"
-            assert retrieved_state["candidate_information"]["name"] == "Test User"
-            
-            conn.close()
-
-    def test_state_update_flow(self):
+        # Save state
+        thread_id = "persist_thread_001"
+        state = {
+            "messages": [],
+            "phase": "introduction",
+            "candidate_information": {"name": "Test User"},
+            "rules": {"format": "short"}
+        }
+        
+        conn.execute(
+            "INSERT OR REPLACE INTO interview_states (thread_id, state_json, phase) VALUES (?, ?, ?)",
+            (thread_id, sqlite3.Binary(_dumps(state)), state["phase"])
+        )
+        
+        # Retrieve state
+        row = conn.execute(
+            "SELECT state_json, phase FROM interview_states WHERE thread_id = ?", (thread_id,)
+        ).fetchone()
+        
+        assert row is not None
+        assert isinstance(row[0], bytes)
+        retrieved_state = json.loads(row[0])
+        assert retrieved_state["phase"] == "introduction"
+        assert retrieved_state["candidate_information"]["name"] == "Test User"
+
+    def test_state_update_flow(self, tuned_conn):
         """Test updating state through interview phases."""
-        import json
+        conn = tuned_conn
+        cursor = conn.cursor()
+        
+        thread_id = "update_test_001"
+        
+        # Initial state, replacing any row left by a previous run against the same database
+        state = {"phase": "introduction", "count": 0}
+        conn.execute(
+            "INSERT OR REPLACE INTO interview_states (thread_id, state_json, phase, message_count) "
+            "VALUES (?, ?, ?, ?)",
+            (thread_id, sqlite3.Binary(_dumps(state)), state["phase"], state["count"])
+        )
+        cursor.execute("SELECT state_json, message_count FROM interview_states WHERE thread_id = ?", (thread_id,))
+        row = cursor.fetchone()
+        assert json.loads(row[0]) == state
+        assert row[1] == 0
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test_update.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS interview_states (
-                    thread_id TEXT PRIMARY KEY,
-                    state_json TEXT,
-                    phase TEXT,
-                    message_count INTEGER DEFAULT 0
-                )
-            ''')
-            
-            thread_id = "update_test_001"
-            
-            # Initial state
-            state = {"phase": "introduction", "count": 0}
-            cursor.execute(
-                "INSERT INTO interview_states (thread_id, state_json, phase, message_count) VALUES (?, ?, ?, ?)",
-                (thread_id, json.dumps(state), state["phase"], 0)
-            )
-            conn.commit()
-            
-            # Update through phases
-            phases = ["introduction", "introduction", "introduction", "q&a", "evaluation"]
-            for i, phase in enumerate(phases):
-                state["phase"] = phase
-                state["count"] = i + 1
-                cursor.execute(
-                    "UPDATE interview_states SET state_json = ?, phase = ?, message_count = ? WHERE thread_id = ?",
-                    (json.dumps(state), phase, state["count"], thread_id)
-                )
-                conn.commit()
-            
-            # Verify final state
-            cursor.execute("SELECT phase, message_count FROM interview_states WHERE thread_id = ?", (thread_id,))
-            row = cursor.fetchone()
-            
-            assert row[0] == "evaluation"
-            assert row[1] == 5
-            
-            conn.close()
-
-    def test_multiple_concurrent_interviews(self):
+        # Update through phases, in a single transaction
+        phases = ["introduction", "introduction", "introduction", "q&a", "evaluation"]
+        rows = [
+            (sqlite3.Binary(_dumps({**state, "phase": phase, "count": i + 1})), phase, i + 1, thread_id)
+            for i, phase in enumerate(phases)
+        ]
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(
+            "UPDATE interview_states SET state_json = ?, phase = ?, message_count = ? WHERE thread_id = ?",
+            rows
+        )
+        cursor.execute("COMMIT")
+        
+        # Verify final state
+        cursor.execute("SELECT phase, message_count FROM interview_states WHERE thread_id = ?", (thread_id,))
+        row = cursor.fetchone()
+        
+        assert row[0] == "evaluation"
+        assert row[1] == 5
+        cursor.execute("SELECT state_json FROM interview_states WHERE thread_id = ?", (thread_id,))
+        assert json.loads(cursor.fetchone()[0]) == {"phase": "evaluation", "count": 5}
+
+    def test_multiple_concurrent_interviews(self, tuned_conn):
         """Test handling multiple interview sessions in the database."""
-        import json
+        conn = tuned_conn
+        cursor = conn.cursor()
+        
+        # Create multiple interviews
+        interviews = [
+            ("concurrent_001", "Alice", "introduction"),
+            ("concurrent_002", "Bob", "q&a"),
+            ("concurrent_003", "Charlie", "evaluation"),
+        ]
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test_concurrent.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS interview_states (
-                    thread_id TEXT PRIMARY KEY,
-                    candidate_name TEXT,
-                    phase TEXT
-                )
-            ''')
-            
-            # Create multiple interviews
-            interviews = [
-                ("thread_001", "Alice", "introduction"),
-                ("thread_002", "Bob", "q&a"),
-                ("thread_003", "Charlie", "evaluation"),
-            ]
-            
-            for thread_id, name, phase in interviews:
-                cursor.execute(
-                    "INSERT INTO interview_states (thread_id, candidate_name, phase) VALUES (?, ?, ?)",
-                    (thread_id, name, phase)
-                )
-            conn.commit()
-            
-            # Verify all interviews exist
-            cursor.execute("SELECT COUNT(*) FROM interview_states")
-            count = cursor.fetchone()[0]
-            assert count == 3
-            
-            # Verify each interview
-            for thread_id, expected_name, expected_phase in interviews:
-                cursor.execute(
-                    "SELECT candidate_name, phase FROM interview_states WHERE thread_id = ?",
-                    (thread_id,)
-                )
-                row = cursor.fetchone()
-                assert row[0] == expected_name
-                assert row[1] == expected_phase
-            
-            conn.close()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(
+            "INSERT OR REPLACE INTO interview_states (thread_id, candidate_name, phase) VALUES (?, ?, ?)",
+            interviews
+        )
+        cursor.execute("COMMIT")
+        
+        # Verify all interviews exist, the table is shared with the other tests
+        count_query = "SELECT COUNT(*) FROM interview_states WHERE thread_id LIKE 'concurrent_%'"
+        cursor.execute(count_query)
+        count = cursor.fetchone()[0]
+        assert count == 3
+
+        # The prefix scan reads the narrow index instead of rows holding the state BLOBs
+        plan = cursor.execute(f"EXPLAIN QUERY PLAN {count_query}").fetchall()
+        assert any("COVERING INDEX idx_thread_cover" in step[-1] for step in plan)
+        
+        # Verify each interview in one query
+        rows = cursor.execute(
+            "SELECT thread_id, candidate_name, phase FROM interview_states "
+            "WHERE thread_id LIKE 'concurrent_%' ORDER BY thread_id"
+        ).fetchall()
+        assert rows == sorted(interviews)
 
 
 class TestLangGraphSQLiteSaverMocked:
@@ -211,7 +240,7 @@ class TestLangGraphSQLiteSaverMocked:
         class MockStateSnapshot:
             def __init__(self):
                 self.values = {
-                    "messages": [MagicMock(content="Hello")],
+                    "messages": [_Msg("Hello")],
                     "phase": "q&a",
                     "candidate_information": {"name": "Test"}
                 }
@@ -230,16 +259,7 @@ class TestStorageModeSwitching:
 
     def test_memory_mode_simulation(self):
         """Test in-memory storage mode behavior."""
-        # Import cache directly
-        cache_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "src", "interview_ai", "core", "cache.py"
-        )
-        spec = importlib.util.spec_from_file_location("cache", cache_path)
-        cache_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(cache_module)
-        
-        cache = cache_module.SimpleCache()
+        cache = SimpleCache()
         
         # Memory mode uses the SimpleCache
         thread_id = "memory_test"
@@ -250,30 +270,44 @@ class TestStorageModeSwitching:
         
         # Memory is cleared when cache object is destroyed
         del cache
-        new_cache = cache_module.SimpleCache()
+        new_cache = SimpleCache()
         assert new_cache.get(thread_id) is None
 
-    def test_database_mode_persistence_simulation(self):
+    def test_database_mode_persistence_simulation(self, tmp_path):
         """Test that database mode persists across sessions."""
-        import json
+        db_path = tmp_path / "persistence_test.db"
+        
+        # Session 1: Save state
+        conn1 = _open_tuned(db_path)
+        conn1.execute("BEGIN IMMEDIATE")
+        conn1.execute("CREATE TABLE IF NOT EXISTS states (id TEXT PRIMARY KEY, data BLOB)")
+        conn1.execute("INSERT INTO states VALUES (?, ?)", ("test", sqlite3.Binary(_dumps({"phase": "saved"}))))
+        conn1.execute("COMMIT")
+        conn1.close()
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "persistence_test.db")
-            
-            # Session 1: Save state
-            conn1 = sqlite3.connect(db_path)
-            cursor1 = conn1.cursor()
-            cursor1.execute("CREATE TABLE IF NOT EXISTS states (id TEXT PRIMARY KEY, data TEXT)")
-            cursor1.execute("INSERT INTO states VALUES (?, ?)", ("test", json.dumps({"phase": "saved"})))
-            conn1.commit()
-            conn1.close()
-            
-            # Session 2: Retrieve state (simulating server restart)
-            conn2 = sqlite3.connect(db_path)
-            cursor2 = conn2.cursor()
-            cursor2.execute("SELECT data FROM states WHERE id = ?", ("test",))
-            row = cursor2.fetchone()
-            conn2.close()
-            
-            assert row is not None
-            assert json.loads(row[0])["phase"] == "saved"
+        # Session 2: Retrieve state (simulating server restart)
+        conn2 = _open_tuned(db_path)
+        row = conn2.execute("SELECT data FROM states WHERE id = ?", ("test",)).fetchone()
+        conn2.close()
+        
+        assert row is not None
+        assert json.loads(row[0])["phase"] == "saved"
+
+    def test_database_mode_shared_cache_session(self, tmp_path):
+        """Test that a second connection reads committed state through the shared page cache."""
+        db_uri = f"{(tmp_path / 'shared_cache_test.db').as_uri()}?cache=shared"
+
+        # Session 2 opens while session 1 is still alive, so it reuses the warm page cache
+        conn1 = _open_tuned(db_uri, uri=True, check_same_thread=False)
+        conn1.execute("BEGIN IMMEDIATE")
+        conn1.execute("CREATE TABLE IF NOT EXISTS states (id TEXT PRIMARY KEY, data BLOB)")
+        conn1.execute("INSERT INTO states VALUES (?, ?)", ("test", sqlite3.Binary(_dumps({"phase": "saved"}))))
+        conn1.execute("COMMIT")
+
+        conn2 = _open_tuned(db_uri, uri=True, check_same_thread=False)
+        row = conn2.execute("SELECT data FROM states WHERE id = ?", ("test",)).fetchone()
+        conn2.close()
+        conn1.close()
+
+        assert row is not None
+        assert json.loads(row[0])["phase"] == "saved"
@@ -70,13 +70,13 @@ class TestSimpleCache:
         assert c.get("d") == 4
 
     def test_get_moves_to_end(self):
-        """Test that getting a key marks it as recently used."""
+        """Test that getting a key with touch marks it as recently used."""
         c = SimpleCache(maxsize=3)
         c.set("a", 1)
         c.set("b", 2)
         c.set("c", 3)
         # Access 'a' to make it recently used
-        c.get("a")
+        c.get("a", touch=True)
         # Now add 'd', 'b' should be evicted (oldest after 'a' was accessed)
         c.set("d", 4)
         assert c.get("b") is None
@@ -84,6 +84,18 @@ class TestSimpleCache:
         assert c.get("c") == 3
         assert c.get("d") == 4
 
+    def test_get_without_touch_keeps_order(self):
+        """Test that a plain get does not change the eviction order."""
+        c = SimpleCache(maxsize=3)
+        c.set("a", 1)
+        c.set("b", 2)
+        c.set("c", 3)
+        c.get("a")
+        # 'a' is still the oldest entry and gets evicted
+        c.set("d", 4)
+        assert c.get("a") is None
+        assert c.get("b") == 2
+
     def test_set_existing_key_moves_to_end(self):
         """Test that updating a key marks it as recently used."""
         c = SimpleCache(maxsize=3)
@@ -97,6 +109,31 @@ class TestSimpleCache:
         assert c.get("b") is None
         assert c.get("a") == 100
 
+    def test_update_existing_key(self):
+        """Test that update applies the function to the stored value and writes it back."""
+        c = SimpleCache()
+        c.set("thread", {"count": 1})
+        result = c.update("thread", lambda data: {**data, "count": data["count"] + 1})
+        assert result == {"count": 2}
+        assert c.get("thread") == {"count": 2}
+
+    def test_update_missing_key(self):
+        """Test that update receives None for a missing key."""
+        c = SimpleCache()
+        result = c.update("missing", lambda data: {"count": 0} if data is None else data)
+        assert result == {"count": 0}
+        assert c.get("missing") == {"count": 0}
+
+    def test_update_moves_to_end(self):
+        """Test that updating a key marks it as recently used."""
+        c = SimpleCache(maxsize=2)
+        c.set("a", 1)
+        c.set("b", 2)
+        c.update("a", lambda value: value + 1)
+        c.set("c", 3)
+        assert c.get("b") is None
+        assert c.get("a") == 2
+
     def test_complex_values(self):
         """Test storing complex values like dicts."""
         c = SimpleCache()
@@ -130,6 +167,43 @@ class TestCacheEdgeCases:
         c.set("", "empty_key_value")
         assert c.get("") == "empty_key_value"
 
+    def test_concurrent_sets(self):
+        """Test that concurrent writers never push the cache over capacity."""
+        import threading
+
+        c = SimpleCache(maxsize=50)
+
+        def writer(prefix):
+            for i in range(500):
+                c.set(f"{prefix}_{i}", i)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(c.cache) == 50
+
+    def test_concurrent_updates(self):
+        """Test that concurrent read-modify-write updates are not lost."""
+        import threading
+
+        c = SimpleCache()
+        c.set("counter", 0)
+
+        def incrementer():
+            for _ in range(1000):
+                c.update("counter", lambda value: value + 1)
+
+        threads = [threading.Thread(target=incrementer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert c.get("counter") == 8000
+
     def test_none_value(self):
         """Test storing None as a value (should be distinguishable from missing key)."""
         c = SimpleCache()
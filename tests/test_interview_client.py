@@ -3,7 +3,7 @@ Tests for interview_ai.clients.interview_client module.
 Tests the InterviewClient class logic without triggering full package imports.
 """
 import pytest
-from datetime import datetime, timezone, timedelta
+import time
 from unittest.mock import MagicMock, patch
 
 
@@ -14,13 +14,9 @@ class TestAnswerExpiryLogic:
         """Test that message is returned when not expired."""
         # Inline the expiry logic for testing
         def check_answer_expiry(user_message, last_updated, time_frame):
-            if datetime.fromisoformat(last_updated) < datetime.now(timezone.utc) - timedelta(
-                minutes=float(time_frame), seconds=float(5)
-            ):
-                return ""
-            return user_message
+            return user_message if time.time() - last_updated <= float(time_frame) * 60 + 5 else ""
         
-        last_updated = datetime.now(timezone.utc).isoformat()
+        last_updated = time.time()
         result = check_answer_expiry("my answer", last_updated, 10)
         
         assert result == "my answer"
@@ -28,14 +24,10 @@ class TestAnswerExpiryLogic:
     def test_returns_empty_when_expired(self):
         """Test that empty string is returned when answer is expired."""
         def check_answer_expiry(user_message, last_updated, time_frame):
-            if datetime.fromisoformat(last_updated) < datetime.now(timezone.utc) - timedelta(
-                minutes=float(time_frame), seconds=float(5)
-            ):
-                return ""
-            return user_message
+            return user_message if time.time() - last_updated <= float(time_frame) * 60 + 5 else ""
         
         # Set last_updated to 10 minutes ago
-        last_updated = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+        last_updated = time.time() - 10 * 60
         result = check_answer_expiry("my answer", last_updated, 1)  # 1 minute time_frame
         
         assert result == ""
@@ -43,14 +35,10 @@ class TestAnswerExpiryLogic:
     def test_includes_5_second_buffer(self):
         """Test that 5 second buffer is included in expiry calculation."""
         def check_answer_expiry(user_message, last_updated, time_frame):
-            if datetime.fromisoformat(last_updated) < datetime.now(timezone.utc) - timedelta(
-                minutes=float(time_frame), seconds=float(5)
-            ):
-                return ""
-            return user_message
+            return user_message if time.time() - last_updated <= float(time_frame) * 60 + 5 else ""
         
         # Set last_updated to exactly 1 minute ago (should still be valid due to 5s buffer)
-        last_updated = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        last_updated = time.time() - 60
         result = check_answer_expiry("my answer", last_updated, 1)
         
         assert result == "my answer"
@@ -58,14 +46,10 @@ class TestAnswerExpiryLogic:
     def test_expires_after_buffer(self):
         """Test that answer expires after time_frame + 5 seconds."""
         def check_answer_expiry(user_message, last_updated, time_frame):
-            if datetime.fromisoformat(last_updated) < datetime.now(timezone.utc) - timedelta(
-                minutes=float(time_frame), seconds=float(5)
-            ):
-                return ""
-            return user_message
+            return user_message if time.time() - last_updated <= float(time_frame) * 60 + 5 else ""
         
         # Set last_updated to 1 minute and 10 seconds ago (exceeds 1 min + 5 sec buffer)
-        last_updated = (datetime.now(timezone.utc) - timedelta(minutes=1, seconds=10)).isoformat()
+        last_updated = time.time() - 70
         result = check_answer_expiry("my answer", last_updated, 1)
         
         assert result == ""
@@ -162,12 +146,11 @@ class TestCachedDataStructure:
     def test_last_updated_timestamp(self):
         """Test last_updated timestamp update."""
         cached_data = {"last_updated": None}
-        cached_data["last_updated"] = datetime.now(timezone.utc).isoformat()
+        cached_data["last_updated"] = time.time()
         
         assert cached_data["last_updated"] is not None
-        # Verify it's a valid ISO format string
-        parsed = datetime.fromisoformat(cached_data["last_updated"])
-        assert parsed.tzinfo is not None
+        # Verify it's a Unix timestamp
+        assert isinstance(cached_data["last_updated"], float)
 
 
 class TestConfigValidation:
@@ -64,6 +64,8 @@ mock_tools_module.generate_csv_tool = create_mock_tool_func("generate_csv_tool")
 mock_tools_module.generate_pdf_tool = create_mock_tool_func("generate_pdf_tool")
 mock_tools_module.call_api_tool = create_mock_tool_func("call_api_tool")
 mock_tools_module.user_tools = []
+mock_tools_module._search_tool = lambda: mock_tools_module.search_internet
+mock_tools_module._user_tools = lambda: []
 
 sys.modules["interview_ai.core.tools"] = mock_tools_module
 sys.modules["interview_ai.core.schemas"] = MagicMock()
@@ -71,12 +73,28 @@ sys.modules["interview_ai.core.schemas"] = MagicMock()
 # Now import operators
 from interview_ai.core.operators import (
     question_generation_function, 
+    answer_collection_function,
+    candidate_information_collection_function,
     interview_perception_function,
     reporting_perception_function,
-    questioner_tools_operator,
-    reporting_tools_operator
+    phase_router_function,
+    _tool_operator
 )
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+import interview_ai.core.operators as _operators_module
+
+questioner_tools_operator = _tool_operator("questioner")
+reporting_tools_operator = _tool_operator("reporting")
+
+
+@pytest.fixture(autouse=True)
+def _keep_operators_module():
+    """
+    Other test modules remove interview_ai.core.operators from sys.modules while they are
+    collected, keep imports and patches in these tests pointed at the module tested here.
+    """
+    with patch.dict(sys.modules, {"interview_ai.core.operators": _operators_module}):
+        yield
 
 class TestQuestionGenerationFunction:
     """Test suite for question_generation_function."""
@@ -214,3 +232,175 @@ class TestInterviewPerceptionFunction:
             assert len(messages) == 1
         # only system prompt at 0
 
+    def test_does_not_duplicate_system_prompt(self):
+        """Test that re-visiting the perception node does not insert the system prompt again."""
+        import interview_ai.core.operators as ops
+
+        with patch.object(ops.settings, 'use_toon_formatting', True):
+            state = {
+                "rules": {},
+                "candidate_information": {"role": "dev", "companies": ""},
+                "messages": [HumanMessage(content="start")]
+            }
+
+            state = interview_perception_function(state)
+            state = interview_perception_function(state)
+
+            messages = state["messages"]
+            assert len(messages) == 3
+            assert sum(isinstance(message, SystemMessage) for message in messages) == 2
+            assert isinstance(messages[2], HumanMessage)
+
+    def test_system_prompt_is_memoized(self):
+        """Test that the system prompt is formatted once for repeated interview inputs."""
+        import interview_ai.core.operators as ops
+
+        ops._format_interviewbot_prompt.cache_clear()
+
+        with patch.object(ops.settings, 'use_toon_formatting', False):
+            for _ in range(3):
+                state = {
+                    "rules": {"time_frame": 1},
+                    "candidate_information": {"role": "dev", "companies": ""},
+                    "messages": []
+                }
+                result = interview_perception_function(state)
+                assert result["messages"][0].content == "InterviewBot Prompt dev"
+
+        assert ops._format_interviewbot_prompt.cache_info().misses == 1
+        assert ops._format_interviewbot_prompt.cache_info().hits == 2
+
+    def test_system_prompt_accepts_unhashable_inputs(self):
+        """Test that list valued candidate information and rules are formatted like before memoization."""
+        import interview_ai.core.operators as ops
+
+        with patch.object(ops.settings, 'use_toon_formatting', False):
+            state = {
+                "rules": {"questions_type": ["theory", "practical"]},
+                "candidate_information": {"role": ["dev", "qa"], "companies": ["Acme"]},
+                "messages": []
+            }
+            result = interview_perception_function(state)
+
+        assert result["messages"][0].content == "InterviewBot Prompt ['dev', 'qa']"
+
+
+class TestCandidateInformationCollectionFunction:
+    """Test suite for candidate_information_collection_function."""
+
+    def test_collects_first_missing_field(self):
+        """Test that only the first missing field is asked for."""
+        import interview_ai.core.operators as ops
+
+        state = {"phase": "introduction", "candidate_information": {"name": "Test User"}}
+
+        with patch.object(ops, "interrupt", return_value="Engineer") as mock_interrupt:
+            result = candidate_information_collection_function(state)
+
+        mock_interrupt.assert_called_once_with("Job role you want to interview for")
+        assert result["candidate_information"] == {"name": "Test User", "role": "Engineer"}
+        assert result["phase"] == "introduction"
+
+    def test_last_field_moves_to_execution(self):
+        """Test that collecting the companies field ends the introduction phase."""
+        import interview_ai.core.operators as ops
+
+        state = {"phase": "introduction", "candidate_information": {"name": "Test User", "role": "Engineer"}}
+
+        with patch.object(ops, "interrupt", return_value="Google"):
+            result = candidate_information_collection_function(state)
+
+        assert result["candidate_information"]["companies"] == "Google"
+        assert result["phase"] == "execution"
+
+
+class TestAnswerCollectionFunction:
+    """Test suite for answer_collection_function."""
+
+    def _questions(self, count):
+        return [MagicMock(question=f"Question {i}") for i in range(count)]
+
+    def test_appends_answer_without_mutating_state(self):
+        """Test that the new answer is appended to a copy of the stored answers."""
+        import interview_ai.core.operators as ops
+
+        previous_answers = [{"question": "Question 0", "answer": "first"}]
+        state = {"questions": self._questions(3), "answers": previous_answers}
+
+        with patch.object(ops, "interrupt", return_value="second"):
+            result = answer_collection_function(state)
+
+        assert result["phase"] == "q&a"
+        assert result["answers"] == previous_answers + [{"question": "Question 1", "answer": "second"}]
+        assert len(previous_answers) == 1
+
+    def test_moves_to_evaluation_after_last_answer(self):
+        """Test that the last answer switches the phase to evaluation."""
+        import interview_ai.core.operators as ops
+
+        state = {"questions": self._questions(1)}
+
+        with patch.object(ops, "interrupt", return_value="only"):
+            result = answer_collection_function(state)
+
+        assert result["phase"] == "evaluation"
+        assert json.loads(result["messages"][0].content) == [{"question": "Question 0", "answer": "only"}]
+
+
+class TestPhaseRouterFunction:
+    """Test suite for phase_router_function."""
+
+    def test_routes_known_phases(self):
+        """Test that every known phase is routed to its node."""
+        assert phase_router_function({"phase": "reporting"}) == "reporting_perception_node"
+        assert phase_router_function({"phase": "introduction"}) == "candidate_information_collection_node"
+        assert phase_router_function({"phase": "q&a"}) == "answer_collection_node"
+        assert phase_router_function({"phase": "evaluation"}) == "evaluation_node"
+
+    def test_defaults_to_perception_node(self):
+        """Test that unknown or missing phases are routed to the perception node."""
+        assert phase_router_function({"phase": "execution"}) == "perception_node"
+        assert phase_router_function({}) == "perception_node"
+
+
+class TestToolFunctions:
+    """Test suite for the lazily built tool nodes."""
+
+    def test_execution_tool_function_runs_cached_tool_node(self):
+        """Test that the execution tool node is built on first call and reused."""
+        state = {"messages": [HumanMessage(content="start")]}
+        config = {"configurable": {"thread_id": "1"}}
+
+        with patch.dict(_operators_module._tool_operators, clear=True), \
+             patch.object(_operators_module, "ToolNode") as mock_tool_node:
+            _operators_module.execution_tool_function(state, config)
+            _operators_module.execution_tool_function(state, config)
+
+        mock_tool_node.assert_called_once_with([mock_tools_module.search_internet])
+        mock_tool_node.return_value.invoke.assert_called_with(state, config)
+
+    def test_concurrent_first_calls_build_once(self):
+        """Test that concurrent first calls share one tool bound model."""
+        import threading
+
+        built = []
+        release = threading.Event()
+
+        def slow_build():
+            built.append(MockModel())
+            release.wait(timeout=5)
+            return built[-1]
+
+        with patch.dict(_operators_module._tool_operators, clear=True), \
+             patch.dict(_operators_module._TOOL_OPERATOR_BUILDERS, {"questioner": slow_build}):
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(_tool_operator("questioner")))
+                for _ in range(4)
+            ]
+            for thread in threads: thread.start()
+            release.set()
+            for thread in threads: thread.join()
+
+        assert len(built) == 1
+        assert all(result is built[0] for result in results)
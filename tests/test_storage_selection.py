@@ -3,6 +3,7 @@ Tests for the Storage class initialization logic.
 """
 import pytest
 import os
+import sqlite3
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -10,11 +11,17 @@ from unittest.mock import MagicMock, patch
 # Corrects path to point to interview-ai/src
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
 
-from interview_ai.core.storage import Storage
+from interview_ai.core.storage import Storage, get_storage
 
 class TestStorageInitialization:
     """Test suite for Storage class backend selection."""
 
+    def setup_method(self):
+        get_storage.cache_clear()
+
+    def teardown_method(self):
+        get_storage.cache_clear()
+
     def test_memory_storage_selection(self):
         """Test initialization of in-memory storage."""
         with patch("interview_ai.core.storage.InMemorySaver") as mock_saver:
@@ -30,32 +37,72 @@ class TestStorageInitialization:
             
             storage = Storage(mode="database", database="sqlite")
             
-            mock_connect.assert_called_with("interview_ai.db", check_same_thread=False)
+            mock_connect.assert_called_with("interview_ai.db", check_same_thread=False, timeout=30)
+            mock_connect.return_value.execute.assert_any_call("PRAGMA journal_mode=WAL")
+            mock_connect.return_value.execute.assert_any_call("PRAGMA synchronous=NORMAL")
             mock_saver.assert_called_once_with(mock_connect.return_value)
             assert storage.storage == mock_saver.return_value
 
+    def test_sqlite_storage_busy_timeout(self):
+        """Test that the SQLite connection keeps the 30s busy timeout after the pragmas run."""
+        real_connect = sqlite3.connect
+
+        with patch("interview_ai.core.storage.SqliteSaver") as mock_saver, \
+             patch("sqlite3.connect", side_effect=lambda database, **kwargs: real_connect(":memory:", **kwargs)):
+
+            Storage(mode="database", database="sqlite")
+
+            connection = mock_saver.call_args.args[0]
+            assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+            connection.close()
+
     def test_mongo_storage_selection(self):
         """Test initialization of MongoDB storage."""
-        with patch("interview_ai.core.storage.MongoDBSaver") as mock_saver, \
-             patch("interview_ai.core.storage.MongoClient") as mock_client, \
+        with patch("langgraph.checkpoint.mongodb.MongoDBSaver") as mock_saver, \
+             patch("pymongo.MongoClient") as mock_client, \
              patch("interview_ai.core.storage.settings") as mock_settings:
             
             mock_settings.database_uri = "mongodb://localhost:27017"
             
             storage = Storage(mode="database", database="mongo")
             
-            mock_client.assert_called_with("mongodb://localhost:27017")
+            args, kwargs = mock_client.call_args
+            assert args == ("mongodb://localhost:27017",)
+            assert kwargs["maxPoolSize"] == 50
+            assert kwargs["minPoolSize"] == 5
+            assert kwargs["waitQueueTimeoutMS"] == 2000
+            assert kwargs["socketTimeoutMS"] == 15000
+            assert kwargs["compressors"] == "zstd,snappy,zlib"
             mock_saver.assert_called_once_with(client=mock_client.return_value)
 
     def test_postgres_storage_selection(self):
         """Test initialization of PostgreSQL storage."""
-        with patch("interview_ai.core.storage.PostgresSaver") as mock_saver, \
-             patch("interview_ai.core.storage.psycopg.connect") as mock_connect, \
+        with patch("langgraph.checkpoint.postgres.PostgresSaver") as mock_saver, \
+             patch("psycopg_pool.ConnectionPool") as mock_pool, \
              patch("interview_ai.core.storage.settings") as mock_settings:
             
             mock_settings.database_uri = "postgresql://localhost:5432"
             
             storage = Storage(mode="database", database="postgres")
             
-            mock_connect.assert_called_with("postgresql://localhost:5432")
-            mock_saver.assert_called_once_with(mock_connect.return_value)
+            args, kwargs = mock_pool.call_args
+            assert args == ("postgresql://localhost:5432",)
+            assert kwargs["min_size"] == 2
+            assert kwargs["max_size"] == 25
+            assert kwargs["kwargs"]["autocommit"] is True
+            assert kwargs["kwargs"]["prepare_threshold"] == 0
+            assert kwargs["open"] is False
+            mock_pool.return_value.open.assert_called_once_with(wait=True, timeout=10)
+            mock_saver.assert_called_once_with(mock_pool.return_value)
+
+    def test_storage_is_shared_per_mode_and_database(self):
+        """Test that repeated Storage instances reuse one checkpointer."""
+        with patch("interview_ai.core.storage.SqliteSaver") as mock_saver, \
+             patch("sqlite3.connect") as mock_connect:
+
+            first = Storage(mode="database", database="sqlite")
+            second = Storage(mode="database", database="sqlite")
+
+            mock_connect.assert_called_once()
+            mock_saver.assert_called_once()
+            assert first.storage is second.storage
@@ -4,7 +4,13 @@ Tests for the custom tools in interview_ai.core.tools.
 import pytest
 import os
 import sys
+import csv
 import json
+import pickle
+import requests
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 # Add src to python path to allow imports
@@ -25,50 +31,166 @@ for mod in modules_to_reload:
     if mod in sys.modules:
         del sys.modules[mod]
 
+from interview_ai.core import tools
 from interview_ai.core.tools import call_api_endpoint, generate_csv_file, generate_pdf_file
 
+# Kept before the inline_pdf_pool fixture patches it
+_get_pdf_pool = tools._get_pdf_pool
+
+@pytest.fixture(autouse=True)
+def inline_pdf_pool():
+    """Stand in a thread for the pdf worker pool, so renders opted into it still see the HTML mock."""
+    tools._parse_template.cache_clear()
+    with ThreadPoolExecutor(max_workers=1) as pool, \
+         patch("interview_ai.core.tools._get_pdf_pool", return_value=pool):
+        yield pool
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    """Request handler that keeps the test output free of access logs."""
+
+    def log_message(self, *args):
+        pass
+
+
+def _unavailable_handler(received):
+    """Build a handler answering every GET and PUT with 503, recording the path or request body."""
+
+    class UnavailableHandler(_QuietHandler):
+        def do_GET(self):
+            received.append(self.path)
+            self._unavailable()
+
+        def do_PUT(self):
+            received.append(self.rfile.read(int(self.headers["Content-Length"])))
+            self._unavailable()
+
+        def _unavailable(self):
+            self.send_response(503)
+            self.send_header("Content-Length", "11")
+            self.end_headers()
+            self.wfile.write(b"Unavailable")
+
+    return UnavailableHandler
+
+
+@pytest.fixture
+def local_server():
+    """Serve a handler class on a local port for the test, returns the server's base url."""
+    servers = []
+
+    def start(handler_cls):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
 class TestTools:
     """Test suite for core tools."""
 
-    @patch("interview_ai.core.tools.requests.request")
-    @patch("builtins.open", new_callable=MagicMock)
-    def test_call_api_endpoint_success(self, mock_open, mock_request):
-        """Test successful API call."""
-        # Setup mock file
-        mock_file = MagicMock()
-        mock_open.return_value = mock_file
+    @patch("interview_ai.core.tools._HTTP_UPLOAD.request")
+    def test_call_api_endpoint_success(self, mock_request, tmp_path):
+        """Test successful API call with a streamed attachment."""
+        attachment = tmp_path / "file.pdf"
+        attachment.write_bytes(b"%PDF-1.7")
         
         # Setup mock response
         mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "application/json; charset=utf-8"}
         mock_response.json.return_value = {"status": "success"}
         mock_request.return_value = mock_response
         
         api_details = {
             "method": "POST",
             "endpoint": "https://api.test/data",
-            "headers": {"Content-Type": "application/json"},
+            "headers": {"Content-Type": "application/json", "X-Api-Key": "secret"},
             "body": {"key": "value"},
-            "attachment": {"file": "/path/to/file.pdf"}
+            "attachment": {"file": str(attachment)}
         }
         
         result = call_api_endpoint(api_details)
         
         assert result == {"status": "success"}
         
-        # Dictionary iteration order not guaranteed, but we only have one item
         mock_request.assert_called_once()
         _, kwargs = mock_request.call_args
+        encoder = kwargs["data"]
         assert kwargs["method"] == "POST"
         assert kwargs["url"] == "https://api.test/data"
-        assert kwargs["headers"] == {"Content-Type": "application/json"}
-        assert kwargs["data"] == {"key": "value"}
-        assert "file" in kwargs["files"]
-        assert kwargs["files"]["file"] == mock_file
+        assert kwargs["headers"] == {"X-Api-Key": "secret", "Content-Type": encoder.content_type}
+        fields = dict(encoder.fields)
+        assert fields["key"] == "value"
+        assert fields["file"][0] == "file.pdf"
+        assert fields["file"][2] == "application/pdf"
+        assert fields["file"][1].closed
+        assert kwargs["timeout"] == (3.05, 60)
+
+    @patch("interview_ai.core.tools._HTTP_UPLOAD.request")
+    def test_call_api_endpoint_list_body_with_attachment(self, mock_request, tmp_path):
+        """Test that list body values are sent as repeated multipart fields next to an attachment."""
+        attachment = tmp_path / "file.pdf"
+        attachment.write_bytes(b"%PDF-1.7")
+        mock_request.return_value = MagicMock(headers={"Content-Type": "application/json"})
+        api_details = {
+            "endpoint": "https://api.test/data",
+            "body": {"tags": ["a", "b"], "score": 90, "note": None},
+            "attachment": {"file": str(attachment)}
+        }
+
+        call_api_endpoint(api_details)
+
+        fields = mock_request.call_args.kwargs["data"].fields
+        assert [field for field in fields if field[0] != "file"] == [("tags", "a"), ("tags", "b"), ("score", "90")]
+
+    def test_call_api_endpoint_nested_body_with_attachment(self, tmp_path):
+        """Test that a nested mapping in the body is reported without calling the API."""
+        attachment = tmp_path / "file.pdf"
+        attachment.write_bytes(b"%PDF-1.7")
+        api_details = {
+            "endpoint": "https://api.test/data",
+            "body": {"candidate": {"name": "Alice"}},
+            "attachment": {"file": str(attachment)}
+        }
+
+        with patch("interview_ai.core.tools._HTTP_UPLOAD.request") as mock_request:
+            result = call_api_endpoint(api_details)
+
+        mock_request.assert_not_called()
+        assert result == {"error": "Attachments require body values to be scalars or lists of scalars"}
+
+    @patch("interview_ai.core.tools._HTTP.request")
+    def test_call_api_endpoint_non_json_response(self, mock_request):
+        """Test that non-JSON responses are returned as text without multipart files."""
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Type": "text/plain"}
+        mock_response.text = "OK"
+        mock_request.return_value = mock_response
+
+        api_details = {
+            "method": "GET",
+            "endpoint": "https://api.test/health",
+            "attachment": None
+        }
+
+        result = call_api_endpoint(api_details)
+
+        assert result == {"text": "OK"}
+        mock_response.json.assert_not_called()
+        _, kwargs = mock_request.call_args
+        assert kwargs["data"] == {}
+        assert kwargs["timeout"] == (3.05, 30)
 
-    @patch("interview_ai.core.tools.requests.request")
+    @patch("interview_ai.core.tools._HTTP.request")
     def test_call_api_endpoint_failure(self, mock_request):
         """Test API call failure handling."""
-        mock_request.side_effect = Exception("Connection error")
+        mock_request.side_effect = requests.ConnectionError("Connection error")
         
         api_details = {
             "method": "GET",
@@ -80,24 +202,287 @@ class TestTools:
         
         result = call_api_endpoint(api_details)
         
-        assert "error" in result
-        assert result["error"] == "Failed to call API endpoint"
+        assert result == {"error": "Connection error"}
 
-    @patch("pandas.DataFrame.to_csv")
-    def test_generate_csv_file(self, mock_to_csv):
+    def test_call_api_endpoint_upload_is_not_retried(self, tmp_path, local_server):
+        """Test that a streamed upload answered with a retryable status is sent once and reported."""
+        attachment = tmp_path / "file.pdf"
+        attachment.write_bytes(b"%PDF-1.7")
+        received = []
+        api_details = {
+            "method": "PUT",
+            "endpoint": f"{local_server(_unavailable_handler(received))}/upload",
+            "attachment": {"file": str(attachment)}
+        }
+
+        with patch("interview_ai.core.tools._HTTP_UPLOAD_TIMEOUT", (3.05, 5)):
+            result = call_api_endpoint(api_details)
+
+        assert result == {"error": "Error 503: Unavailable"}
+        assert len(received) == 1
+        assert b"%PDF-1.7" in received[0]
+
+    def test_call_api_endpoint_reports_status_after_retries(self, local_server):
+        """Test that a request still failing with a retryable status reports the last response."""
+        received = []
+        api_details = {"method": "GET", "endpoint": f"{local_server(_unavailable_handler(received))}/health"}
+
+        with patch.object(tools._HTTP_ADAPTER.max_retries, "backoff_factor", 0):
+            result = call_api_endpoint(api_details)
+
+        assert result == {"error": "Error 503: Unavailable"}
+        assert len(received) == 3
+
+    def test_call_api_endpoint_does_not_keep_cookies(self, local_server):
+        """Test that a cookie set by one API call is not sent on later calls to the same host."""
+        received = []
+
+        class CookieHandler(_QuietHandler):
+            def do_GET(self):
+                received.append(self.headers.get("Cookie"))
+                self.send_response(200)
+                self.send_header("Set-Cookie", "session=interview-1; Path=/")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+        api_details = {"method": "GET", "endpoint": f"{local_server(CookieHandler)}/data"}
+
+        call_api_endpoint(api_details)
+        call_api_endpoint(api_details)
+
+        assert received == [None, None]
+        assert len(tools._HTTP.cookies) == 0
+
+    def test_call_api_endpoint_string_body_with_attachment(self, tmp_path):
+        """Test that a string body with an attachment is reported without calling the API."""
+        attachment = tmp_path / "file.pdf"
+        attachment.write_bytes(b"%PDF-1.7")
+        api_details = {
+            "endpoint": "https://api.test/data",
+            "body": '{"k": "v"}',
+            "attachment": {"file": str(attachment)}
+        }
+
+        with patch("interview_ai.core.tools._HTTP_UPLOAD.request") as mock_request, \
+             patch("interview_ai.core.tools._HTTP.request") as mock_plain_request:
+            result = call_api_endpoint(api_details)
+
+        mock_request.assert_not_called()
+        mock_plain_request.assert_not_called()
+        assert result == {"error": "Attachments require the body to be a key-value mapping"}
+
+    @pytest.mark.parametrize("attachment", ["/tmp/report.pdf", ["/tmp/report.pdf"]])
+    def test_call_api_endpoint_attachment_not_a_mapping(self, attachment):
+        """Test that an attachment given as a path or list of paths is reported without calling the API."""
+        api_details = {"endpoint": "https://api.test/data", "attachment": attachment}
+
+        with patch("interview_ai.core.tools._HTTP_UPLOAD.request") as mock_request, \
+             patch("interview_ai.core.tools._HTTP.request") as mock_plain_request:
+            result = call_api_endpoint(api_details)
+
+        mock_request.assert_not_called()
+        mock_plain_request.assert_not_called()
+        assert result == {"error": "Attachments must be a mapping of field names to file paths"}
+
+    def test_call_api_endpoint_missing_attachment(self):
+        """Test that an unreadable attachment is reported without calling the API."""
+        api_details = {"endpoint": "https://api.test/data", "attachment": {"file": "/missing/file.pdf"}}
+
+        with patch("interview_ai.core.tools._HTTP.request") as mock_request:
+            result = call_api_endpoint(api_details)
+
+        mock_request.assert_not_called()
+        assert "/missing/file.pdf" in result["error"]
+
+    def test_generate_csv_file(self, tmp_path):
         """Test CSV generation."""
+        (tmp_path / "interview_ai").mkdir()
         data = {
             "Name": ["Alice", "Bob"],
             "Score": [90, 85]
         }
         
-        result = generate_csv_file(data)
+        with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")):
+            result = generate_csv_file(data)
         
         assert result["file_name"] == "Interview_AI.csv"
         assert result["mime"] == "text/csv"
-        mock_to_csv.assert_called_once()
         # Verify path construction
         assert result["file_path"].endswith("interview_ai/Interview_AI.csv")
+        with open(result["file_path"], newline="") as f:
+            assert f.read() == "Name,Score\nAlice,90\nBob,85\n"
+
+    def test_generate_csv_file_pads_uneven_columns(self, tmp_path):
+        """Test that shorter columns are padded with empty values and scalars repeat on every row."""
+        (tmp_path / "interview_ai").mkdir()
+        data = {"Name": ["Alice", "Bob"], "Score": [90], "Round": "Final"}
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")):
+            result = generate_csv_file(data)
+
+        with open(result["file_path"], newline="") as f:
+            assert f.read() == "Name,Score,Round\nAlice,90,Final\nBob,,Final\n"
+
+    def test_generate_csv_file_keeps_mixed_numeric_values(self, tmp_path):
+        """Test that mixed int, float and missing values are written as given, without float upcasting."""
+        (tmp_path / "interview_ai").mkdir()
+        data = {"Name": ["Alice", "Bob", "Carol"], "Score": [90, 85.5, None]}
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")):
+            result = generate_csv_file(data)
+
+        with open(result["file_path"], newline="") as f:
+            assert f.read() == "Name,Score\nAlice,90\nBob,85.5\nCarol,\n"
+
+    def test_generate_csv_file_matches_pandas_output(self, tmp_path):
+        """Test that plain dict data is written as pandas would write the same DataFrame."""
+        import pandas
+
+        (tmp_path / "interview_ai").mkdir()
+        samples = [
+            {"Name": ["Alice", "Bob"], "Round": "Final"},
+            {"Score": {"Alice": 90, "Bob": 85}},
+            {"Name": ["Alice", "Bob"], "Score": [90, 85]},
+        ]
+
+        for data in samples:
+            with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")):
+                result = generate_csv_file(data, in_memory=True)
+            assert result["bytes"].decode() == pandas.DataFrame(data).to_csv(index=False, lineterminator="\n")
+
+    def test_generate_csv_file_in_memory(self, tmp_path):
+        """Test that in memory csv output returns bytes without writing a file."""
+        output_dir = tmp_path / "interview_ai"
+        output_dir.mkdir()
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(output_dir)):
+            result = generate_csv_file({"Name": ["Alice"], "Score": [90]}, in_memory=True)
+
+        assert result["bytes"] == b"Name,Score\nAlice,90\n"
+        assert result["file_name"] == "Interview_AI.csv"
+        assert "file_path" not in result
+        assert os.listdir(output_dir) == []
+
+    @pytest.mark.skipif(not hasattr(os, "sendfile"), reason="os.sendfile not available")
+    def test_open_generated_file_returns_descriptor(self, tmp_path):
+        """Test that a generated file can be opened as a descriptor for sendfile."""
+        output_dir = tmp_path / "interview_ai"
+        output_dir.mkdir()
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(output_dir)):
+            result = tools.open_generated_file(generate_csv_file({"Name": ["Alice"]}))
+
+        try:
+            assert result["size"] == len(b"Name\nAlice\n")
+            assert os.read(result["fd"], result["size"]) == b"Name\nAlice\n"
+            assert result["file_path"].endswith("Interview_AI.csv")
+        finally:
+            os.close(result["fd"])
+
+    def test_open_generated_file_without_sendfile(self):
+        """Test that file details are returned unchanged where sendfile is unavailable."""
+        file_details = {"file_path": "/tmp/Interview_AI.pdf"}
+
+        with patch("interview_ai.core.tools.os") as mock_os:
+            del mock_os.sendfile
+            assert tools.open_generated_file(file_details) is file_details
+
+    def test_file_tools_do_not_expose_in_memory(self):
+        """Test that the LLM facing tool schemas only offer file path output."""
+        for tool in (tools.generate_csv_tool, tools.generate_pdf_tool):
+            assert "in_memory" not in tool.args
+
+    def test_generate_csv_file_large_columns(self, tmp_path):
+        """Test that large column data is written completely in chunks."""
+        (tmp_path / "interview_ai").mkdir()
+        data = {"Id": list(range(120_000))}
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")):
+            result = generate_csv_file(data)
+
+        with open(result["file_path"], newline="") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 120_001
+        assert lines[-1] == "119999"
+
+    def test_generate_csv_file_large_column_after_scalar(self, tmp_path):
+        """Test that the longest column decides chunked writing, whatever the column order."""
+        (tmp_path / "interview_ai").mkdir()
+        data = {"Round": "Final", "Id": list(range(120_000))}
+        writerows = csv.DictWriter.writerows
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")), \
+             patch.object(csv.DictWriter, "writerows", autospec=True, side_effect=writerows) as mock_writerows:
+            result = generate_csv_file(data)
+
+        assert mock_writerows.call_count == 3
+        with open(result["file_path"], newline="") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 120_001
+        assert lines[-1].endswith(",119999")
+
+    def test_generate_csv_file_replaces_existing_file(self, tmp_path):
+        """Test that the csv is written through a temporary file that replaces the old one."""
+        output_dir = tmp_path / "interview_ai"
+        output_dir.mkdir()
+        (output_dir / "Interview_AI.csv").write_text("stale")
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(output_dir)):
+            result = generate_csv_file({"Name": ["Alice"]})
+
+        assert os.listdir(output_dir) == ["Interview_AI.csv"]
+        with open(result["file_path"], newline="") as f:
+            assert f.read() == "Name\nAlice\n"
+
+    def test_generate_csv_file_keeps_existing_file_on_error(self, tmp_path):
+        """Test that a failed write leaves the previous file and no temporary file."""
+        output_dir = tmp_path / "interview_ai"
+        output_dir.mkdir()
+        (output_dir / "Interview_AI.csv").write_text("previous")
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(output_dir)), \
+             patch("interview_ai.core.tools._rows_from_columns", side_effect=ValueError("bad data")):
+            with pytest.raises(ValueError):
+                generate_csv_file({"Name": ["Alice"]})
+
+        assert os.listdir(output_dir) == ["Interview_AI.csv"]
+        assert (output_dir / "Interview_AI.csv").read_text() == "previous"
+
+    @patch("pandas.DataFrame.to_csv")
+    def test_generate_csv_file_from_dataframe(self, mock_to_csv):
+        """Test that DataFrame input is written by pandas."""
+        import pandas
+
+        result = generate_csv_file(pandas.DataFrame({"Name": ["Alice"]}))
+
+        mock_to_csv.assert_called_once()
+        assert mock_to_csv.call_args.kwargs["chunksize"] is None
+        assert result["file_path"].endswith("interview_ai/Interview_AI.csv")
+
+    def test_generate_csv_file_flattens_multiindex(self, tmp_path):
+        """Test that MultiIndex frames are written with a flat header and no index."""
+        import pandas
+
+        (tmp_path / "interview_ai").mkdir()
+        columns = pandas.MultiIndex.from_tuples([("Score", "Round1"), ("Score", "")])
+        index = pandas.MultiIndex.from_tuples([("a", 1)], names=["k", "n"])
+        data = pandas.DataFrame([[90, 85]], columns=columns, index=index)
+
+        with patch("interview_ai.core.tools._output_dir", return_value=str(tmp_path / "interview_ai")):
+            result = generate_csv_file(data)
+
+        with open(result["file_path"], newline="") as f:
+            assert f.read().splitlines() == ["Score_Round1,Score", "90,85"]
+
+    @patch("pandas.DataFrame.to_csv")
+    def test_generate_csv_file_from_large_dataframe(self, mock_to_csv):
+        """Test that large DataFrames are written in chunks."""
+        import pandas
+
+        generate_csv_file(pandas.DataFrame({"Id": range(20_000)}))
+
+        assert mock_to_csv.call_args.kwargs["chunksize"] == 50_000
 
     @patch("interview_ai.core.tools.HTML")
     def test_generate_pdf_file(self, mock_html_cls):
@@ -113,3 +498,192 @@ class TestTools:
         assert result["mime"] == "application/pdf"
         mock_html_instance.write_pdf.assert_called_once()
         assert result["file_path"].endswith("interview_ai/Interview_AI.pdf")
+        _, kwargs = mock_html_instance.write_pdf.call_args
+        resources = tools._pdf_resources()
+        assert kwargs["font_config"] is resources["font_config"]
+        assert kwargs["stylesheets"] is resources["stylesheets"]
+        assert kwargs["cache"] is tools._image_cache()
+        assert mock_html_cls.call_args.kwargs["url_fetcher"] is resources["url_fetcher"]
+
+    @patch("interview_ai.core.tools.HTML")
+    def test_generate_pdf_file_in_memory(self, mock_html_cls):
+        """Test that in memory pdf output returns the rendered bytes."""
+        mock_html_cls.return_value.write_pdf.return_value = b"%PDF-1.7"
+
+        result = generate_pdf_file("<html><body>Test</body></html>", in_memory=True)
+
+        assert result["bytes"] == b"%PDF-1.7"
+        assert result["mime"] == "application/pdf"
+        assert "file_path" not in result
+        args, _ = mock_html_cls.return_value.write_pdf.call_args
+        assert args == ()
+
+    @patch("interview_ai.core.tools.HTML")
+    def test_generate_pdf_file_reuses_parsed_template(self, mock_html_cls):
+        """Test that a repeated template is parsed once and rendered twice."""
+        template = "<html><body>Report</body></html>"
+
+        generate_pdf_file(template, "Alice")
+        generate_pdf_file(template, "Bob")
+
+        mock_html_cls.assert_called_once()
+        assert mock_html_cls.return_value.write_pdf.call_count == 2
+
+    @patch("interview_ai.core.tools.HTML")
+    def test_generate_pdf_file_renders_inline_by_default(self, mock_html_cls):
+        """Test that no worker processes are started unless pdf_render_workers is set."""
+        mock_html_cls.return_value.write_pdf.return_value = b"%PDF-1.7"
+
+        with patch("interview_ai.core.tools._get_pdf_pool") as mock_pool:
+            result = generate_pdf_file("<html><body>Test</body></html>", in_memory=True)
+
+        mock_pool.assert_not_called()
+        assert result["bytes"] == b"%PDF-1.7"
+
+    @patch("interview_ai.core.tools.HTML")
+    def test_generate_pdf_file_uses_pool_when_enabled(self, mock_html_cls, inline_pdf_pool):
+        """Test that renders are submitted to the worker pool once pdf_render_workers is set."""
+        mock_html_cls.return_value.write_pdf.return_value = b"%PDF-1.7"
+
+        with patch.object(tools.settings, "pdf_render_workers", 2), \
+             patch.object(inline_pdf_pool, "submit", wraps=inline_pdf_pool.submit) as mock_submit:
+            result = generate_pdf_file("<html><body>Test</body></html>", in_memory=True)
+
+        mock_submit.assert_called_once_with(tools._render_pdf, "<html><body>Test</body></html>", None)
+        assert result["bytes"] == b"%PDF-1.7"
+
+    def test_pdf_pool_uses_spawned_workers(self):
+        """Test that the pdf pool does not fork the server process."""
+        with patch.object(tools.settings, "pdf_render_workers", 3), \
+             patch("interview_ai.core.tools.ProcessPoolExecutor") as mock_pool:
+            _get_pdf_pool.__wrapped__()
+
+        _, kwargs = mock_pool.call_args
+        assert kwargs["mp_context"].get_start_method() == "spawn"
+        assert kwargs["max_workers"] == 3
+
+    def test_pdf_pool_task_pickles_by_reference(self):
+        """Test that the render callable submitted to the pool pickles as a reference to this module."""
+        with patch.object(tools.settings, "pdf_render_workers", 2), \
+             patch("interview_ai.core.tools._get_pdf_pool") as mock_pool:
+            mock_pool.return_value.submit.return_value.result.return_value = b"%PDF-1.7"
+            generate_pdf_file("<html><body>Test</body></html>", in_memory=True)
+
+        submitted = mock_pool.return_value.submit.call_args.args[0]
+        assert pickle.loads(pickle.dumps(submitted)) is tools._render_pdf
+
+    @pytest.mark.parametrize("link", [
+        '<link rel="stylesheet" href="/assets/print_format.bundle.css?v=2">',
+        "<LINK href='/static/print_format.bundle.css' rel='stylesheet' media='print'>",
+    ])
+    def test_bundle_link_pattern_matches_stylesheet_bundles(self, link):
+        """Test that the precompiled pattern strips print_format bundle stylesheet links only."""
+        kept = '<link rel="icon" href="/favicon.bundle.ico">'
+        assert tools._BUNDLE_LINK_RE.sub("", link + kept) == kept
+
+    @pytest.mark.parametrize("link", [
+        '<link rel="stylesheet" href="/static/bundles/report-theme.css">',
+        '<link rel="stylesheet" href="https://fonts.example/unbundled.css">',
+        '<link rel="stylesheet" href="/static/app.bundle.css">',
+    ])
+    def test_bundle_link_pattern_keeps_other_stylesheets(self, link):
+        """Test that ordinary stylesheets whose path mentions bundle are not stripped."""
+        assert tools._BUNDLE_LINK_RE.sub("", link) == link
+
+    def test_image_cache_trims_least_recently_used(self):
+        """Test that the pdf image cache keeps only its most recently used entries."""
+        cache = tools._ImageCache(maxsize=2)
+        cache["a"], cache["b"], cache["c"] = 1, 2, 3
+        assert len(cache) == 3
+
+        cache["a"]
+        cache.trim()
+
+        assert list(cache) == ["c", "a"]
+
+    def test_image_cache_is_per_thread(self):
+        """Test that concurrent renders in different threads never share an image cache."""
+        caches = []
+        thread = threading.Thread(target=lambda: caches.append(tools._image_cache()))
+        thread.start()
+        thread.join()
+
+        assert tools._image_cache() is tools._image_cache()
+        assert caches[0] is not tools._image_cache()
+
+    @patch("interview_ai.core.tools._HTTP.get")
+    def test_url_fetcher_uses_shared_session(self, mock_get):
+        """Test that remote pdf resources are fetched through the shared session."""
+        mock_get.return_value = MagicMock(
+            url="https://cdn.test/logo.png",
+            content=b"png",
+            headers={"Content-Type": "image/png", "Content-Encoding": "gzip"},
+            status_code=200
+        )
+
+        response = tools._pdf_resources()["url_fetcher"].fetch("https://cdn.test/logo.png")
+
+        mock_get.assert_called_once_with("https://cdn.test/logo.png", headers=None, timeout=5)
+        assert response.read() == b"png"
+        assert "Content-Encoding" not in response.headers
+
+    @patch("interview_ai.core.tools.HTML")
+    def test_generate_pdf_file_strips_bundle_stylesheets(self, mock_html_cls):
+        """Test that the print_format stylesheet bundle is removed before rendering."""
+        template = (
+            '<html><head><link rel="stylesheet" href="/assets/print_format.bundle.css">'
+            '<link rel="stylesheet" href="/static/bundles/report.css"></head><body>Test</body></html>'
+        )
+
+        generate_pdf_file(template)
+
+        html = mock_html_cls.call_args.kwargs["string"]
+        assert "print_format.bundle" not in html
+        assert 'href="/static/bundles/report.css"' in html
+
+
+class TestLazyTools:
+    """Test suite for lazily created tools."""
+
+    def test_search_tool_is_built_once_on_access(self):
+        """Test that search_internet is created on first access and then reused."""
+        tools._search_tool.cache_clear()
+        with patch("langchain_community.tools.DuckDuckGoSearchResults") as mock_search, \
+             patch.object(tools.settings, "internet_search", "duckduckgo"):
+            first = tools.search_internet
+            second = tools.search_internet
+
+        mock_search.assert_called_once()
+        assert first is second is mock_search.return_value
+        tools._search_tool.cache_clear()
+
+    def test_user_tools_are_fetched_on_access(self):
+        """Test that user_tools are fetched when the attribute is accessed."""
+        with patch("interview_ai.core.tools.fetch_user_tools", return_value=["tool"]) as mock_fetch:
+            assert tools.user_tools == ["tool"]
+
+        mock_fetch.assert_called_once()
+
+    def test_heavy_imports_are_resolved_on_access(self):
+        """Test that pandas is imported on first attribute access and then kept as a global."""
+        import pandas
+
+        tools.__dict__.pop("pandas", None)
+        assert "pandas" not in tools.__dict__
+        assert tools.pandas is pandas
+        assert tools.__dict__["pandas"] is pandas
+
+    def test_star_import_exports_tools(self):
+        """Test that the module's public names, including lazy ones, resolve for star imports."""
+        with patch.object(tools, "_search_tool", return_value="search"), \
+             patch.object(tools, "_user_tools", return_value=[]):
+            namespace = {}
+            exec("from interview_ai.core.tools import *", namespace)
+
+        assert set(tools.__all__) <= set(namespace)
+        assert namespace["search_internet"] == "search"
+
+    def test_unknown_attribute_raises(self):
+        """Test that other missing attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            tools.not_a_tool
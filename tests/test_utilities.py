@@ -6,6 +6,7 @@ Note: load_interview_rules and load_cache require more complex mocking due to de
 import pytest
 import os
 import sys
+import json
 import tempfile
 import importlib.util
 from unittest.mock import MagicMock, patch
@@ -148,6 +149,95 @@ class TestFetchUserTools:
             assert result == []
 
 
+class TestLoadInterviewRules:
+    """Test suite for load_interview_rules function."""
+
+    def _write_rules(self, tmpdir, rules):
+        interview_dir = os.path.join(tmpdir, "interview_ai")
+        os.makedirs(interview_dir, exist_ok=True)
+        rules_path = os.path.join(interview_dir, "interview_rules.json")
+        with open(rules_path, "w") as f:
+            json.dump(rules, f)
+        return rules_path
+
+    def test_rules_file_is_parsed_once(self):
+        """Test that repeated loads reuse the parsed rules file."""
+        utilities = _import_module("interview_ai.core.utilities", "utilities.py")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_rules(tmpdir, {"short": {"time_frame": 1}, "coding": {"time_frame": 10}})
+
+            with patch("os.getcwd", return_value=tmpdir):
+                assert utilities.load_interview_rules("short") == {"time_frame": 1}
+                assert utilities.load_interview_rules("coding") == {"time_frame": 10}
+
+            assert utilities._read_interview_rules.cache_info().misses == 1
+            assert utilities._read_interview_rules.cache_info().hits == 1
+
+    def test_returned_rules_are_copies(self):
+        """Test that modifying the returned rules does not affect later loads."""
+        utilities = _import_module("interview_ai.core.utilities", "utilities.py")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write_rules(tmpdir, {"short": {"time_frame": 1}})
+
+            with patch("os.getcwd", return_value=tmpdir):
+                rules = utilities.load_interview_rules("short")
+                rules["time_frame"] = 99
+                assert utilities.load_interview_rules("short") == {"time_frame": 1}
+
+    def test_reloads_modified_rules_file(self):
+        """Test that a modified rules file is parsed again."""
+        utilities = _import_module("interview_ai.core.utilities", "utilities.py")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rules_path = self._write_rules(tmpdir, {"short": {"time_frame": 1}})
+
+            with patch("os.getcwd", return_value=tmpdir):
+                assert utilities.load_interview_rules("short") == {"time_frame": 1}
+                self._write_rules(tmpdir, {"short": {"time_frame": 2}})
+                stat = os.stat(rules_path)
+                os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                assert utilities.load_interview_rules("short") == {"time_frame": 2}
+
+
+class TestFetchUserToolsCaching:
+    """Test suite for the modification time keyed user tools cache."""
+
+    def _write_tools(self, tmpdir, body):
+        interview_dir = os.path.join(tmpdir, "interview_ai")
+        os.makedirs(interview_dir, exist_ok=True)
+        tools_path = os.path.join(interview_dir, "tools.py")
+        with open(tools_path, "w") as f:
+            f.write(body)
+        return tools_path
+
+    def test_tools_file_is_executed_once_until_modified(self):
+        """Test that the tools file is only re-executed after it changes."""
+        utilities = _import_module("interview_ai.core.utilities", "utilities.py")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tools_path = self._write_tools(tmpdir, "user_tools = ['tool1']\n")
+
+            with patch("os.getcwd", return_value=tmpdir):
+                assert utilities.fetch_user_tools() == ["tool1"]
+                assert utilities.fetch_user_tools() == ["tool1"]
+                assert utilities._load_user_tools.cache_info().misses == 1
+
+                self._write_tools(tmpdir, "user_tools = ['tool1', 'tool2']\n")
+                stat = os.stat(tools_path)
+                os.utime(tools_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                assert utilities.fetch_user_tools() == ["tool1", "tool2"]
+
+    def test_returns_empty_list_without_tools_file(self):
+        """Test that a missing tools file returns an empty list."""
+        utilities = _import_module("interview_ai.core.utilities", "utilities.py")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("os.getcwd", return_value=tmpdir):
+                assert utilities.fetch_user_tools() == []
+
+
 class TestCacheOperations:
     """Test cache-related functionality."""
 